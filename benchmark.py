@@ -0,0 +1,258 @@
+import gc
+import os
+import sys
+import time
+import shutil
+import tempfile
+from lexer import lexer
+from yacc import parse_program
+from type_inference import infer_types
+from inliner import inline_calls
+from snapshot import save_snapshot, load_snapshot
+from modules import load_module, resolve_imports
+import modules
+import metrics
+
+# --- Benchmarks del intérprete ---
+# Uso: python benchmark.py [repeticiones]
+
+# Programa con bucles, asignaciones y llamadas a funciones
+PROGRAMA_BUCLES = """
+decree paso(x) {
+    yield x shatter 7;
+}
+total devote 0;
+march (i devote 0; i < 20000; i devote i inherit 1) {
+    total devote total inherit paso(i);
+}
+"""
+
+# Programa dominado por llamadas a funciones pequeñas (como en calculadora.txt)
+PROGRAMA_LLAMADAS = """
+decree suma(a, b) {
+    resultado devote a inherit b;
+    yield resultado;
+}
+decree multiplicacion(a, b) {
+    resultado devote a forge b;
+    yield resultado;
+}
+decree cuadrado(x) {
+    yield multiplicacion(x, x);
+}
+total devote 0;
+march (i devote 0; i < 20000; i devote suma(i, 1)) {
+    total devote suma(total, cuadrado(i));
+}
+"""
+
+# Módulo con una función que llama a otra, y un programa que redefine esa otra función
+MODULO = """
+decree suma(a, b) {
+    yield a inherit b;
+}
+decree doble(x) {
+    yield suma(x, x);
+}
+"""
+
+PROGRAMA_MODULO = """
+summon "modulo.txt";
+decree suma(a, b) {
+    yield a plunder b;
+}
+resultado devote doble(3);
+"""
+
+# Funciones que reciben una función como argumento, y un programa que define otra 'f'
+FUNCIONES_COMO_VALOR = """
+decree doble(x) {
+    yield x forge 2;
+}
+decree aplicar(f, v) {
+    yield f(v) inherit (f == f) forge 0;
+}
+decree usar(v) {
+    yield aplicar(doble, v);
+}
+"""
+
+PROGRAMA_COMO_VALOR = """
+decree f(x) {
+    yield x inherit 100;
+}
+resultado devote usar(3);
+"""
+
+def compile_program(code, inline=False, global_context=None):
+    ast, errors = parse_program(code, lexer)
+    if errors: raise SystemExit("El programa del benchmark tiene errores de sintaxis")
+    if inline: inline_calls(ast, global_context or {})
+    infer_types(ast, global_context or {})
+    return ast
+
+# Mejor tiempo de varias repeticiones (menos sensible al ruido)
+def best_time(ast, repeats):
+    best = float('inf')
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            ast.evaluate([{}])
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+# Mejor tiempo de varias repeticiones de una acción cualquiera
+def best_action_time(action, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# Compara el intérprete sin métricas, después de activarlas y desactivarlas, y con métricas
+def bench_metrics(repeats):
+    ast = compile_program(PROGRAMA_BUCLES)
+    evaluators = {cls: cls.__dict__['evaluate'] for cls in metrics._node_classes()}
+
+    best_time(ast, 1)  # calentamiento
+    baseline = best_time(ast, repeats)
+    collected = metrics.enable()
+    enabled = best_time(ast, repeats)
+    metrics.disable()
+    disabled = best_time(ast, repeats)
+
+    # Al desactivar se restauran exactamente las mismas funciones: costo adicional nulo
+    restored = all(cls.__dict__['evaluate'] is original for cls, original in evaluators.items())
+
+    print("--- Metricas ---")
+    print(f"sin metricas:           {baseline * 1000:9.2f} ms")
+    print(f"metricas desactivadas:  {disabled * 1000:9.2f} ms ({disabled / baseline:.2f}x)")
+    print(f"metricas activadas:     {enabled * 1000:9.2f} ms ({enabled / baseline:.2f}x)")
+    print(f"metodos originales restaurados: {'si' if restored else 'NO'}")
+    print(f"nodos evaluados por ejecucion: {collected.counters['nodes_evaluated'] // repeats}")
+    return restored
+
+# Compara un programa con muchas llamadas con y sin expansión en línea
+def bench_calls(repeats):
+    plain = compile_program(PROGRAMA_LLAMADAS)
+    inlined = compile_program(PROGRAMA_LLAMADAS, inline=True)
+
+    best_time(plain, 1)  # calentamiento
+    plain_time = best_time(plain, repeats)
+    inlined_time = best_time(inlined, repeats)
+
+    context_plain, context_inlined = [{}], [{}]
+    plain.evaluate(context_plain)
+    inlined.evaluate(context_inlined)
+    same = context_plain[0]['total'] == context_inlined[0]['total']
+
+    print("--- Llamadas a funciones ---")
+    print(f"con cache de llamadas:  {plain_time * 1000:9.2f} ms")
+    print(f"con expansion en linea: {inlined_time * 1000:9.2f} ms ({plain_time / inlined_time:.2f}x mas rapido)")
+    print(f"mismo resultado: {'si' if same else 'NO'}")
+    return same
+
+# Compara el camino completo de un programa con y sin snapshot del preludio: sin él se
+# analiza y ejecuta el preludio y luego se compila el programa; con él se carga el
+# snapshot y se compila el programa (análisis, expansión en línea y tipos).
+def bench_snapshot(repeats):
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "calculadora.txt"), encoding="utf-8") as file:
+        code = file.read()
+    split = code.index("opcion devote")
+    prelude, program = code[:split], code[split:]  # funciones 'decree' y menú
+
+    def run_prelude(text):
+        context = {}
+        compile_program(text, inline=True).evaluate([context])
+        return context
+
+    def cold_start():
+        context = run_prelude(prelude)
+        compile_program(program, inline=True, global_context=context)
+        return context
+
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "preludio.snap")
+    save_snapshot(path, run_prelude(prelude))
+
+    def warm_start():
+        context = load_snapshot(path)
+        compile_program(program, inline=True, global_context=context)
+        return context
+
+    try:
+        cold_start()  # calentamiento
+        cold_time = best_action_time(cold_start, repeats)
+        warm_time = best_action_time(warm_start, repeats)
+        same = sorted(warm_start()) == sorted(cold_start())
+
+        # Un programa que inicia desde un snapshot se comporta igual que sin él
+        value_path = os.path.join(folder, "como_valor.snap")
+        save_snapshot(value_path, run_prelude(FUNCIONES_COMO_VALOR))
+        warm = [load_snapshot(value_path)]
+        compile_program(PROGRAMA_COMO_VALOR, inline=True, global_context=warm[0]).evaluate(warm)
+        cold = [{}]
+        compile_program(FUNCIONES_COMO_VALOR + PROGRAMA_COMO_VALOR, inline=True).evaluate(cold)
+        same_result = warm[0]['resultado'] == cold[0]['resultado'] == 6
+    finally:
+        shutil.rmtree(folder)
+
+    print("--- Snapshot del preludio ---")
+    print(f"sin snapshot:           {cold_time * 1000:9.3f} ms")
+    print(f"con snapshot:           {warm_time * 1000:9.3f} ms ({cold_time / warm_time:.1f}x mas rapido)")
+    print(f"mismas definiciones: {'si' if same else 'NO'}")
+    print(f"mismo resultado que sin snapshot: {'si' if same_result else 'NO'}")
+    return same and same_result
+
+# Compara compilar un módulo con reutilizarlo desde la caché, y comprueba que el
+# programa que lo importa ve su propia redefinición de 'suma' (doble(3) = 3 - 3) y
+# que las funciones recibidas como argumento no se reemplazan por las globales
+def bench_modules(repeats):
+    folder = tempfile.mkdtemp()
+    module_path = os.path.join(folder, "modulo.txt")
+    with open(module_path, "w", encoding="utf-8") as file:
+        file.write(MODULO)
+    with open(os.path.join(folder, "como_valor.txt"), "w", encoding="utf-8") as file:
+        file.write(FUNCIONES_COMO_VALOR)
+
+    def compile_module():
+        modules._module_cache.pop(os.path.abspath(module_path), None)
+        load_module(module_path)
+
+    def run_program(code=PROGRAMA_MODULO):
+        ast, errors = parse_program(code, lexer)
+        resolve_imports(ast, os.path.join(folder, "programa.txt"))
+        inline_calls(ast, {})
+        infer_types(ast, {})
+        context = [{}]
+        ast.evaluate(context)
+        return context[0]['resultado']
+
+    try:
+        compile_time = best_action_time(compile_module, repeats)
+        cached_time = best_action_time(lambda: load_module(module_path), repeats)
+        same = run_program() == 0 and run_program() == 0  # la segunda vez usa la caché
+        same = same and run_program('summon "como_valor.txt";' + PROGRAMA_COMO_VALOR) == 6
+    finally:
+        shutil.rmtree(folder)
+
+    print("--- Modulos ---")
+    print(f"compilar modulo:        {compile_time * 1000:9.3f} ms")
+    print(f"modulo en cache:        {cached_time * 1000:9.3f} ms ({compile_time / cached_time:.1f}x mas rapido)")
+    print(f"redefiniciones y funciones como valor respetadas: {'si' if same else 'NO'}")
+    return same
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    ok = bench_metrics(repeats)
+    ok = bench_calls(repeats) and ok
+    ok = bench_snapshot(repeats) and ok
+    ok = bench_modules(repeats) and ok
+    sys.exit(0 if ok else 1)
+
+if __name__ == '__main__':
+    main()
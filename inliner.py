@@ -0,0 +1,195 @@
+import copy
+import weakref
+from yacc import (
+    Node, LiteralNode, IdentifierNode, BinaryOpNode, UnaryOpNode, AssignmentNode,
+    BlockNode, PariasCallNode, FunctionDefNode, FunctionCallNode, ReturnNode, ImportNode,
+)
+
+# --- Expansión en línea de funciones pequeñas ---
+# Reemplaza las llamadas a funciones 'decree' cuyo cuerpo es una sola expresión pura por
+# esa expresión, sustituyendo los parámetros por los argumentos. Cuerpos aceptados:
+#     yield <expr>;
+#     <var> devote <expr>; yield <var>;
+# La expresión solo puede contener literales, identificadores y operadores, así que la
+# función no es recursiva ni tiene efectos. Como la expresión se evalúa en el mismo
+# contexto que la llamada, el resultado es idéntico al de la llamada original.
+#
+# Solo se reescribe el código del programa, nunca el cuerpo de un 'decree': la función
+# puede sobrevivir al programa (en un snapshot, en la terminal o en un módulo importado)
+# y otro programa puede redefinir las funciones que llama. Para expandir llamadas
+# anidadas se usan copias de trabajo de las funciones.
+
+MAX_INLINE_NODES = 16  # tamaño máximo (en nodos) de la expresión expandida
+
+def _pure_size(node):
+    # Cantidad de nodos de una expresión pura, o None si no es pura
+    if isinstance(node, (LiteralNode, IdentifierNode)): return 1
+    if isinstance(node, BinaryOpNode):
+        left, right = _pure_size(node.left), _pure_size(node.right)
+        return None if left is None or right is None else left + right + 1
+    if isinstance(node, UnaryOpNode):
+        size = _pure_size(node.expr)
+        return None if size is None else size + 1
+    return None
+
+def _identifiers(node):
+    if isinstance(node, IdentifierNode): return {node.name}
+    names = set()
+    for child in node.get_children():
+        names |= _identifiers(child)
+    return names
+
+# Devuelve la expresión de un cuerpo con una de las formas aceptadas, o None
+def _body_expr(func_def):
+    statements = func_def.body.statements
+    if len(statements) == 1 and isinstance(statements[0], ReturnNode):
+        return statements[0].expr
+    if (len(statements) == 2 and isinstance(statements[0], AssignmentNode)
+          and isinstance(statements[1], ReturnNode)
+          and isinstance(statements[1].expr, IdentifierNode)
+          and statements[1].expr.name == statements[0].identifier):
+        return statements[0].expr
+    return None
+
+# Devuelve la expresión del cuerpo si la función se puede expandir, o None
+def inline_body(func_def):
+    expr = _body_expr(func_def)
+    if expr is None or (_pure_size(expr) or MAX_INLINE_NODES + 1) > MAX_INLINE_NODES: return None
+    # Todo parámetro (sin repetir) debe usarse, para que un argumento indefinido siga fallando
+    params = set(func_def.params)
+    if len(params) != len(func_def.params) or not params <= _identifiers(expr): return None
+    return expr
+
+def _substitute(node, arguments):
+    if isinstance(node, IdentifierNode):
+        return arguments.get(node.name, node)
+    clone = copy.copy(node)
+    if isinstance(node, BinaryOpNode):
+        clone.left, clone.right = _substitute(node.left, arguments), _substitute(node.right, arguments)
+    elif isinstance(node, UnaryOpNode):
+        clone.expr = _substitute(node.expr, arguments)
+    return clone
+
+def _walk(node, visit):
+    # Recorre todos los nodos del AST (incluye los atributos que son listas de nodos)
+    if not isinstance(node, Node): return
+    visit(node)
+    for value in vars(node).values():
+        if isinstance(value, Node): _walk(value, visit)
+        elif isinstance(value, list):
+            for item in value: _walk(item, visit)
+
+def _rewrite(node, replace):
+    # Reemplaza los hijos de cada nodo por replace(hijo), de abajo hacia arriba.
+    # No entra en las definiciones de funciones.
+    for name, value in vars(node).items():
+        if isinstance(value, Node) and not isinstance(value, FunctionDefNode):
+            _rewrite(value, replace)
+            setattr(node, name, replace(value))
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                if isinstance(item, Node) and not isinstance(item, FunctionDefNode):
+                    _rewrite(item, replace)
+                    value[i] = replace(item)
+
+# Nombres usados en el cuerpo de una función: (identificadores, variables asignadas,
+# funciones definidas, funciones llamadas). Los cuerpos no se modifican, así que el
+# resultado se guarda por función (por ejemplo, las de un snapshot o de la terminal).
+_summaries = weakref.WeakKeyDictionary()
+
+def _summary(func_def):
+    summary = _summaries.get(func_def)
+    if summary is None:
+        summary = (set(), set(), set(), set())
+        identifiers, assigned, defined, called = summary
+        def visit(node):
+            if isinstance(node, FunctionDefNode): defined.add(node.name)
+            elif isinstance(node, IdentifierNode): identifiers.add(node.name)
+            elif isinstance(node, (AssignmentNode, PariasCallNode)): assigned.add(node.identifier)
+            elif isinstance(node, FunctionCallNode): called.add(node.name)
+        _walk(func_def, visit)
+        _summaries[func_def] = summary
+    return summary
+
+# Busca las funciones cuya definición no cambia durante todo el programa
+def _fixed_functions(ast, global_context):
+    inherited = {name: value for name, value in (global_context or {}).items() if isinstance(value, FunctionDefNode)}
+
+    # Solo las funciones del bloque inicial de 'decree' quedan definidas antes de
+    # ejecutar cualquier otra sentencia; None marca una definición posterior.
+    definitions, imported = {}, []
+    leading = True
+    for stmt in ast.statements:
+        if isinstance(stmt, FunctionDefNode):
+            definitions.setdefault(stmt.name, []).append(stmt if leading else None)
+        elif isinstance(stmt, ImportNode):
+            if stmt.module is None: return {}  # módulo sin resolver: no se sabe qué define
+            for name, func_def in stmt.module.functions.items():
+                definitions.setdefault(name, []).append(func_def if leading else None)
+                imported.append(func_def)
+        else:
+            leading = False
+
+    def_names, escaped, reassigned = set(inherited) | set(definitions), set(), set()
+    def visit(node):
+        if isinstance(node, FunctionDefNode): def_names.add(node.name)
+        elif isinstance(node, IdentifierNode): escaped.add(node.name)
+        elif isinstance(node, (AssignmentNode, PariasCallNode)): reassigned.add(node.identifier)
+    _walk(ast, visit)
+    # Las funciones heredadas e importadas también se ejecutan durante el programa: una que
+    # pase una función como argumento hace que un parámetro pueda ocultar a una global
+    for func_def in list(inherited.values()) + imported:
+        identifiers, assigned, defined, _ = _summary(func_def)
+        escaped |= identifiers
+        reassigned |= assigned
+        def_names |= defined
+
+    # Si alguna función se usa como valor, una variable local podría ocultar a otra función
+    if escaped & def_names: return {}
+
+    fixed = {}
+    for name in set(inherited) | set(definitions):
+        defs = definitions.get(name)
+        if name in reassigned or (defs and None in defs): continue
+        fixed[name] = defs[-1] if defs else inherited[name]
+    return fixed
+
+def _replacer(candidates, inlined):
+    def replace(node):
+        if not isinstance(node, FunctionCallNode) or node.name not in candidates: return node
+        func_def, expr = candidates[node.name]
+        if len(node.args) != len(func_def.params): return node  # conserva el error de aridad
+        if not all(isinstance(arg, (LiteralNode, IdentifierNode)) for arg in node.args): return node
+        inlined[0] += 1
+        return _substitute(expr, dict(zip(func_def.params, node.args)))
+    return replace
+
+# Punto de entrada: expande en el código del programa las llamadas a funciones pequeñas.
+# Primero se expanden las llamadas dentro de copias de trabajo de las funciones hasta
+# que no haya cambios, porque eso puede volverlas expandibles; solo se copian las que
+# tienen un cuerpo de una expresión y llaman a una función expandible. Después se
+# reescribe el programa una sola vez. Devuelve la cantidad de llamadas expandidas en él.
+def inline_calls(ast, global_context=None):
+    if not isinstance(ast, BlockNode): return 0
+    fixed = _fixed_functions(ast, global_context)
+    working = {}  # nombre -> copia de trabajo con llamadas expandidas
+    while True:
+        candidates = {}
+        for name, func_def in fixed.items():
+            func_def = working.get(name, func_def)
+            expr = inline_body(func_def)
+            if expr is not None: candidates[name] = (func_def, expr)
+        if not candidates: return 0
+        for name, func_def in fixed.items():
+            if (name not in working and name not in candidates and _body_expr(func_def) is not None
+                    and not _summary(func_def)[3].isdisjoint(candidates)):
+                working[name] = copy.deepcopy(func_def)
+        expanded = [0]
+        replace = _replacer(candidates, expanded)
+        for name, func_def in working.items():
+            if name not in candidates: _rewrite(func_def.body, replace)
+        if not expanded[0]: break
+
+    inlined = [0]
+    _rewrite(ast, _replacer(candidates, inlined))
+    return inlined[0]
@@ -0,0 +1,112 @@
+import csv
+import json
+import queue
+import sys
+import threading
+
+# --- Fuentes de entrada para 'inquire' ---
+# Cada programa lee sus entradas desde una fuente intercambiable. Por defecto se usa la
+# terminal (input()), pero también se pueden usar valores precargados (línea de comandos,
+# JSON o CSV), la entrada estándar con buffer o una cola por programa (uso en servidor).
+# Las fuentes no interactivas convierten cada valor a número una sola vez, al cargarlo.
+# La fuente activa es por hilo, para que varios programas puedan ejecutarse a la vez.
+
+class InputExhausted(Exception):
+    pass
+
+# Convierte el texto ingresado a int, float o lo deja como cadena
+def convert_input(text):
+    try: return int(text)
+    except ValueError:
+        try: return float(text)
+        except ValueError: return text
+
+def _convert_value(value):
+    # Los valores de JSON ya tienen tipo; las cadenas se tratan como texto ingresado
+    return convert_input(value) if isinstance(value, str) else value
+
+def _echo(prompt):
+    # Muestra el mensaje igual que input(), aunque el valor no venga de la terminal
+    if prompt != "":
+        sys.stdout.write(str(prompt))
+
+# Entrada interactiva desde la terminal (comportamiento original de 'inquire')
+class TerminalInput:
+    def read(self, prompt):
+        return convert_input(input(prompt))
+
+# Vector de valores precargados. Con convert=False se reutiliza una lista ya convertida
+# (por ejemplo la de load_input_values) sin copiarla ni convertirla otra vez.
+class ValueInput:
+    def __init__(self, values, convert=True):
+        self.values = [_convert_value(value) for value in values] if convert else values
+        self.position = 0
+
+    def read(self, prompt):
+        _echo(prompt)
+        if self.position >= len(self.values):
+            raise InputExhausted("no quedan valores de entrada")
+        value = self.values[self.position]
+        self.position += 1
+        return value
+
+# Lee líneas de un flujo (por defecto la entrada estándar) sin pasar por input()
+class BufferedStdinInput:
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdin
+
+    def read(self, prompt):
+        _echo(prompt)
+        line = self.stream.readline()
+        if not line:
+            raise InputExhausted("no quedan valores de entrada")
+        return convert_input(line.rstrip("\r\n"))
+
+# Cola de valores por programa: otro hilo (por ejemplo un servidor) agrega entradas con put()
+class QueueInput:
+    _CLOSED = object()
+
+    def __init__(self, timeout=None):
+        self.queue = queue.Queue()
+        self.timeout = timeout
+
+    def put(self, value):
+        self.queue.put(_convert_value(value))
+
+    # Indica que no habrá más entradas: las lecturas siguientes fallan en vez de esperar
+    def close(self):
+        self.queue.put(self._CLOSED)
+
+    def read(self, prompt):
+        _echo(prompt)
+        try:
+            value = self.queue.get(timeout=self.timeout)
+        except queue.Empty:
+            raise InputExhausted("tiempo de espera agotado para la entrada")
+        if value is self._CLOSED:
+            self.queue.put(value)
+            raise InputExhausted("no quedan valores de entrada")
+        return value
+
+# Carga valores desde un archivo: .json (lista), .csv (celdas por filas) u otro (una por línea)
+def load_input_values(path):
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        if path.lower().endswith(".json"):
+            values = json.load(file)
+            if not isinstance(values, list) or any(isinstance(v, (list, dict)) for v in values):
+                raise ValueError("el JSON de entrada debe ser una lista de valores simples")
+        elif path.lower().endswith(".csv"):
+            values = [cell for row in csv.reader(file) for cell in row]
+        else:
+            values = file.read().splitlines()
+    return [_convert_value(value) for value in values]
+
+_local = threading.local()
+_default_source = TerminalInput()
+
+# Define la fuente de entrada del hilo actual (None vuelve a la terminal)
+def set_input_source(source):
+    _local.source = source
+
+def get_input_source():
+    return getattr(_local, 'source', None) or _default_source
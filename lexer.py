@@ -1,3 +1,4 @@
+import bisect
 import ply.lex as lex
 
 # --- Definición de Tokens ---
@@ -44,6 +45,7 @@ reservadas = {
     'conquistar': 'CONQUISTAR',
     'decree': 'DECREE',
     'yield': 'YIELD',
+    'summon': 'IMPORTAR',
 }
 
 # Se añaden las palabras reservadas a la lista principal de tokens.
@@ -67,6 +69,49 @@ t_LLAVEDER = r'\}'
 t_PUNTOYCOMA = r';'
 t_COMA = r','
 
+# --- Registro de Errores ---
+# Los errores léxicos y sintácticos se guardan como objetos estructurados en 'lexer.errors'
+# (además de imprimirse), para poder informar todos los errores de una sola pasada.
+
+class ParseError:
+    def __init__(self, kind, message, lineno, column, line_text):
+        self.kind = kind            # 'lexico' o 'sintactico'
+        self.message = message
+        self.lineno = lineno
+        self.column = column
+        self.line_text = line_text
+    def __repr__(self): return f"ParseError({self.kind!r}, linea {self.lineno}, columna {self.column})"
+    def __str__(self): return self.message
+
+# Índice de inicios de línea, construido una sola vez por entrada y solo si hay errores.
+def line_offsets(lexer):
+    if getattr(lexer, 'line_index_data', None) is not lexer.lexdata:
+        data = lexer.lexdata
+        offsets = [0]
+        pos = data.find('\n')
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = data.find('\n', pos + 1)
+        lexer.line_offsets, lexer.line_index_data = offsets, data
+    return lexer.line_offsets
+
+# Devuelve (linea, columna, texto de la linea) para una posición de la entrada.
+def locate(lexer, lexpos):
+    offsets = line_offsets(lexer)
+    index = bisect.bisect_right(offsets, lexpos) - 1
+    start = offsets[index]
+    end = lexer.lexdata.find('\n', start)
+    if end == -1: end = len(lexer.lexdata)
+    return index + 1, lexpos - start + 1, lexer.lexdata[start:end]
+
+def report_error(lexer, kind, lexpos, message):
+    lineno, column, line_text = locate(lexer, lexpos)
+    error = ParseError(kind, message, lineno, column, line_text)
+    errors = getattr(lexer, 'errors', None)
+    if errors is not None: errors.append(error)
+    print(message)
+    return error
+
 # --- Reglas de Tokens con Lógica ---
 
 # Ignorar espacios en blanco y tabulaciones.
@@ -87,13 +132,13 @@ def t_newline(t):
 
 def t_IDENTIFICADOR_INVALIDO(t):
     r'\d+[A-Za-z_]+[A-Za-z0-9_]*'
-    print(f"Error lexico: El nombre de una variable no puede comenzar con un numero -> {t.value}")
+    report_error(t.lexer, 'lexico', t.lexpos, f"Error lexico: El nombre de una variable no puede comenzar con un numero -> {t.value}")
     t.lexer.skip(len(t.value))
     return None
 
 def t_COMILLAS_NO_CERRADAS(t):
     r'\"[^\"]*$'
-    print(f"Error lexico: Cadena sin cerrar -> {t.value}")
+    report_error(t.lexer, 'lexico', t.lexpos, f"Error lexico: Cadena sin cerrar -> {t.value}")
     t.lexer.skip(len(t.value))
     return None
 
@@ -127,7 +172,7 @@ def t_CADENA(t):
 # Regla general para el manejo de errores léxicos.
 # Se activa si ningún otro patrón coincide.
 def t_error(t):
-    print(f"Caracter ilegal: {t.value[0]}")
+    report_error(t.lexer, 'lexico', t.lexpos, f"Caracter ilegal: {t.value[0]}")
     t.lexer.skip(1)
 
 # Construye el analizador léxico.
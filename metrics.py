@@ -0,0 +1,225 @@
+import json
+import time
+import yacc
+from yacc import (
+    Node, IdentifierNode, BlockNode, WhileNode, ForNode, AssignmentNode, PariasCallNode,
+    ConquistarCallNode, FunctionCallNode,
+)
+
+# --- Métricas y trazas del intérprete ---
+# La instrumentación reemplaza los métodos 'evaluate' de los nodos solo mientras está
+# activa y los restaura al desactivarla: con las métricas apagadas se ejecuta el código
+# original sin ninguna comprobación adicional (ver benchmark.py).
+#
+# Eventos de traza: trace(evento, nodo, detalle) con evento en
+#   'enter' / 'exit'   -> detalle: None / valor devuelto por el nodo
+#   'call' / 'return'  -> detalle: nombre de la función / valor retornado
+# 'exit' y 'return' se emiten siempre; si el nodo terminó con una excepción (por ejemplo
+# ReturnValue de 'yield' o EvaluationError), el detalle es esa excepción.
+#   'assign'           -> detalle: (variable, valor)
+
+COUNTERS = {
+    'nodes_evaluated': "Nodos del AST evaluados",
+    'function_calls': "Llamadas a funciones 'decree'",
+    'scope_lookups': "Busquedas de variables y funciones en la pila de contextos",
+    'loop_iterations': "Iteraciones de 'vigil' y 'march'",
+    'random_draws': "Numeros aleatorios usados por 'parias' y 'conquistar'",
+    'assignments': "Asignaciones de variables",
+}
+
+# Histograma con cubetas fijas (formato acumulativo al exportar, como Prometheus)
+class Histogram:
+    def __init__(self, description, buckets):
+        self.description = description
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # la última cubeta es +Inf
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        index = 0
+        while index < len(self.buckets) and value > self.buckets[index]: index += 1
+        self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        total, result = 0, []
+        for bound, count in zip(self.buckets + ['+Inf'], self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+class Metrics:
+    def __init__(self):
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.histograms = {
+            'call_duration_seconds': Histogram("Duracion de las llamadas a funciones",
+                                               (0.00001, 0.0001, 0.001, 0.01, 0.1, 1)),
+            'loop_iterations_per_loop': Histogram("Iteraciones por ejecucion de un bucle",
+                                                  (0, 1, 10, 100, 1000, 10000)),
+            'call_depth': Histogram("Profundidad de la pila de llamadas", (1, 2, 4, 8, 16, 32, 64)),
+        }
+
+    def to_dict(self):
+        return {
+            'counters': dict(self.counters),
+            'histograms': {
+                name: {'buckets': {str(bound): count for bound, count in h.cumulative()},
+                       'sum': h.sum, 'count': h.count}
+                for name, h in self.histograms.items()
+            },
+        }
+
+    def to_json(self, indent=2):
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self, prefix="medievo"):
+        lines = []
+        for name, value in self.counters.items():
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# HELP {metric} {COUNTERS[name]}")
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        for name, h in self.histograms.items():
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {h.description}")
+            lines.append(f"# TYPE {metric} histogram")
+            for bound, count in h.cumulative():
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {count}')
+            lines.append(f"{metric}_sum {h.sum}")
+            lines.append(f"{metric}_count {h.count}")
+        return "\n".join(lines) + "\n"
+
+# Envoltorio del generador aleatorio que cuenta los números usados
+class _CountingRandom:
+    def __init__(self, generator, counters):
+        self.generator, self.counters = generator, counters
+    def randint(self, a, b):
+        self.counters['random_draws'] += 1
+        return self.generator.randint(a, b)
+    def random(self):
+        self.counters['random_draws'] += 1
+        return self.generator.random()
+
+# Estado de la instrumentación activa (None si está desactivada)
+_active = None
+
+def _node_classes():
+    pending, found = [Node], []
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        if cls is not Node and 'evaluate' in cls.__dict__: found.append(cls)
+    return found
+
+def _instrument(cls, original, metrics, trace, loop_counts, depth):
+    counters = metrics.counters
+
+    def evaluate(self, context_stack):
+        counters['nodes_evaluated'] += 1
+        if not trace: return original(self, context_stack)
+        trace('enter', self, None)
+        detail = None
+        try:
+            detail = original(self, context_stack)
+            return detail
+        except BaseException as e:
+            detail = e
+            raise
+        finally:
+            trace('exit', self, detail)
+
+    if cls is IdentifierNode:
+        def evaluate(self, context_stack, _base=evaluate):
+            counters['scope_lookups'] += 1
+            return _base(self, context_stack)
+
+    elif cls is BlockNode:
+        def evaluate(self, context_stack, _base=evaluate):
+            if id(self) in loop_counts:
+                loop_counts[id(self)] += 1
+                counters['loop_iterations'] += 1
+            return _base(self, context_stack)
+
+    elif cls in (WhileNode, ForNode):
+        histogram = metrics.histograms['loop_iterations_per_loop']
+        def evaluate(self, context_stack, _base=evaluate):
+            block_id = id(self.block)
+            outer = loop_counts.get(block_id)
+            loop_counts[block_id] = 0
+            try:
+                return _base(self, context_stack)
+            finally:
+                histogram.observe(loop_counts.pop(block_id))
+                if outer is not None: loop_counts[block_id] = outer
+
+    elif cls is ConquistarCallNode:
+        def evaluate(self, context_stack, _base=evaluate):
+            # Busca el ejército en la pila y, si pierde, la recorre otra vez para actualizarlo
+            if isinstance(self.ejercito, IdentifierNode): counters['scope_lookups'] += 1
+            result = _base(self, context_stack)
+            if result is False and isinstance(self.ejercito, IdentifierNode): counters['scope_lookups'] += 1
+            return result
+
+    elif cls in (AssignmentNode, PariasCallNode):
+        def evaluate(self, context_stack, _base=evaluate):
+            result = _base(self, context_stack)
+            counters['assignments'] += 1
+            if trace: trace('assign', self, (self.identifier, context_stack[-1][self.identifier]))
+            return result
+
+    elif cls is FunctionCallNode:
+        durations = metrics.histograms['call_duration_seconds']
+        depths = metrics.histograms['call_depth']
+        def evaluate(self, context_stack, _base=evaluate):
+            counters['function_calls'] += 1
+            if self.cached_epoch != yacc.function_epoch:
+                counters['scope_lookups'] += 1  # sin caché: busca la función en la pila
+            depth[0] += 1
+            depths.observe(depth[0])
+            if trace: trace('call', self, self.name)
+            start = time.perf_counter()
+            detail = None
+            try:
+                detail = _base(self, context_stack)
+                return detail
+            except BaseException as e:
+                detail = e
+                raise
+            finally:
+                durations.observe(time.perf_counter() - start)
+                depth[0] -= 1
+                if trace: trace('return', self, detail)
+
+    return evaluate
+
+# Activa la instrumentación y devuelve el objeto Metrics, que puede leerse durante o
+# después de la ejecución. 'trace' es un callback opcional por evento.
+def enable(trace=None, metrics=None):
+    global _active
+    if _active is not None: disable()
+    metrics = metrics or Metrics()
+    loop_counts, depth = {}, [0]
+    originals = {}
+    for cls in _node_classes():
+        originals[cls] = cls.__dict__['evaluate']
+        cls.evaluate = _instrument(cls, originals[cls], metrics, trace, loop_counts, depth)
+    original_rng = yacc.rng
+    yacc.set_random_generator(_CountingRandom(original_rng, metrics.counters))
+    _active = (originals, original_rng, metrics)
+    return metrics
+
+# Restaura los métodos originales: el camino sin métricas queda intacto.
+def disable():
+    global _active
+    if _active is None: return None
+    originals, original_rng, metrics = _active
+    for cls, original in originals.items():
+        cls.evaluate = original
+    yacc.set_random_generator(original_rng)
+    _active = None
+    return metrics
+
+def is_enabled():
+    return _active is not None
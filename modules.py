@@ -0,0 +1,96 @@
+import os
+from lexer import lexer
+from yacc import parse_program, BlockNode, FunctionDefNode, ImportNode
+from type_inference import infer_types
+
+# --- Módulos ---
+# 'summon "archivo.txt";' importa las funciones 'decree' de otro archivo. Cada módulo se
+# compila (análisis e inferencia de tipos) una sola vez por proceso y
+# se guarda en una caché por ruta y fecha de modificación, así que un módulo compartido
+# por varios programas se analiza una sola vez. Las rutas relativas se resuelven desde la
+# carpeta del archivo que importa.
+
+class ModuleError(Exception):
+    pass
+
+class Module:
+    def __init__(self, path, mtime, functions, dependencies):
+        self.path = path
+        self.mtime = mtime
+        self.functions = functions        # nombre -> FunctionDefNode, en orden de definición
+        self.dependencies = dependencies  # módulos importados por este módulo
+
+# Un módulo de la caché sigue siendo válido si ni él ni sus dependencias cambiaron
+def _is_fresh(module):
+    try:
+        if os.stat(module.path).st_mtime_ns != module.mtime: return False
+    except OSError:
+        return False
+    return all(_is_fresh(dependency) for dependency in module.dependencies)
+
+# Caché de módulos compilados: ruta absoluta -> Module
+_module_cache = {}
+
+def _compile_module(path, loading):
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            code = file.read()
+    except OSError as e:
+        raise ModuleError(f"Error: No se pudo leer el modulo '{path}': {e.strerror}")
+
+    ast, errors = parse_program(code, lexer)
+    syntax_errors = [error for error in errors if error.kind == 'sintactico']
+    if syntax_errors or not ast:
+        raise ModuleError(f"Error: El modulo '{path}' tiene {len(syntax_errors)} error(es) de sintaxis.")
+
+    resolve_imports(ast, path, loading)
+    functions, dependencies = {}, []
+    ignored = 0
+    for stmt in ast.statements:
+        if isinstance(stmt, FunctionDefNode): functions[stmt.name] = stmt
+        elif isinstance(stmt, ImportNode):
+            functions.update(stmt.module.functions)
+            dependencies.append(stmt.module)
+        else: ignored += 1
+    if ignored:
+        print(f"Advertencia: el modulo '{path}' tiene {ignored} sentencia(s) que no son 'decree'; se ignoran.")
+
+    # Las llamadas dentro de las funciones no se expanden: quien importa el módulo puede
+    # redefinir las funciones que llaman (ver inliner.py)
+    module_ast = BlockNode([stmt for stmt in ast.statements if isinstance(stmt, (FunctionDefNode, ImportNode))])
+    # Los cuerpos de 'decree' pueden no ejecutarse: sus errores de tipo son advertencias
+    type_warnings = []
+    infer_types(module_ast, None, type_warnings)
+    for warning in type_warnings:
+        print(f"Advertencia en el modulo '{path}': {warning}")
+    return functions, dependencies
+
+# Devuelve el módulo compilado, usando la caché si el archivo no cambió.
+# 'loading' es la cadena de módulos que se están importando (para detectar ciclos).
+def load_module(path, loading=()):
+    path = os.path.abspath(path)
+    if path in loading:
+        cycle = " -> ".join(os.path.basename(p) for p in loading[loading.index(path):] + (path,))
+        raise ModuleError(f"Error: Importacion circular: {cycle}")
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        raise ModuleError(f"Error: El modulo '{path}' no fue encontrado")
+
+    cached = _module_cache.get(path)
+    if cached is not None and cached.mtime == mtime and _is_fresh(cached):
+        return cached
+    module = Module(path, mtime, *_compile_module(path, loading + (path,)))
+    _module_cache[path] = module
+    return module
+
+# Carga los módulos de todas las sentencias 'summon' del programa.
+# 'source_path' es el archivo del programa (None para código escrito en la terminal).
+def resolve_imports(ast, source_path=None, loading=None):
+    if not isinstance(ast, BlockNode): return
+    if loading is None:
+        loading = (os.path.abspath(source_path),) if source_path else ()
+    base_dir = os.path.dirname(os.path.abspath(source_path)) if source_path else os.getcwd()
+    for stmt in ast.statements:
+        if isinstance(stmt, ImportNode):
+            stmt.module = load_module(os.path.join(base_dir, stmt.path), loading)
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'rightASIGNARleftUNIRleftORleftANDnonassocMAYORMENORMAYORIGUALMENORIGUALIGUALDESIGUALrightNOTleftSUMARESTAleftMULTIPLICACIONDIVISIONleftMODULOrightMENOSAND ASIGNAR CADENA COMA CONQUISTAR DECREE DESIGUAL DIVISION ELSE FOR IDENTIFICADOR IF IGUAL INQUIRE LLAVEDER LLAVEIZQ MAYOR MAYORIGUAL MENOR MENORIGUAL MENOS MODULO MULTIPLICACION NOT NUMERO OR PARDER PARIAS PARIZQ PRINT PUNTOYCOMA RESTA SUMA UNIR WHILE YIELDinicio : \n              | sentencia inicio\n              | declaracion_funcion iniciosentencia : asignacion PUNTOYCOMA\n                   | expresion PUNTOYCOMA\n                   | condicional\n                   | print PUNTOYCOMA\n                   | ciclo\n                   | sentencia_yielddeclaracion_funcion : DECREE IDENTIFICADOR PARIZQ parametros_opcionales PARDER LLAVEIZQ bloque LLAVEDERparametros_opcionales : \n                             | parametros_listparametros_list : IDENTIFICADOR\n                       | IDENTIFICADOR COMA parametros_listsentencia_yield : YIELD expresion PUNTOYCOMA\n                       | YIELD PUNTOYCOMAasignacion : IDENTIFICADOR ASIGNAR expresionexpresion : expresion UNIR expresionexpresion : expresion SUMA expresion\n                 | expresion RESTA expresion\n                 | expresion MULTIPLICACION expresion\n                 | expresion DIVISION expresion\n                 | expresion MODULO expresionexpresion : expresion MAYOR expresion\n                 | expresion MENOR expresion\n                 | expresion MAYORIGUAL expresion\n                 | expresion MENORIGUAL expresion\n                 | expresion IGUAL expresion\n                 | expresion DESIGUAL expresion\n                 | expresion AND expresion\n                 | expresion OR expresion\n                 | NOT expresioncondicional : IF PARIZQ expresion PARDER LLAVEIZQ bloque LLAVEDER\n                   | IF PARIZQ expresion PARDER LLAVEIZQ bloque LLAVEDER ELSE LLAVEIZQ bloque LLAVEDERciclo : WHILE PARIZQ expresion PARDER LLAVEIZQ bloque LLAVEDER\n             | FOR PARIZQ asignacion PUNTOYCOMA expresion PUNTOYCOMA asignacion PARDER LLAVEIZQ bloque LLAVEDERbloque : \n              | sentencia bloqueexpresion : PARIZQ expresion PARDERexpresion : CADENAexpresion : NUMEROexpresion : IDENTIFICADORexpresion : MENOS expresion %prec MENOSexpresiones_list : expresion\n                        | expresion COMA expresiones_listargumentos_opcionales : \n                             | expresiones_listprint : PRINT PARIZQ expresiones_list PARDERexpresion : PARIAS PARIZQ IDENTIFICADOR PARDERexpresion : INQUIRE PARIZQ expresion PARDERexpresion : CONQUISTAR PARIZQ expresion COMA expresion COMA expresion PARDERexpresion : IDENTIFICADOR PARIZQ argumentos_opcionales PARDER'
+_lr_signature = 'rightASIGNARleftUNIRleftORleftANDnonassocMAYORMENORMAYORIGUALMENORIGUALIGUALDESIGUALrightNOTleftSUMARESTAleftMULTIPLICACIONDIVISIONleftMODULOrightMENOSAND ASIGNAR CADENA COMA CONQUISTAR DECREE DESIGUAL DIVISION ELSE FOR IDENTIFICADOR IF IGUAL IMPORTAR INQUIRE LLAVEDER LLAVEIZQ MAYOR MAYORIGUAL MENOR MENORIGUAL MENOS MODULO MULTIPLICACION NOT NUMERO OR PARDER PARIAS PARIZQ PRINT PUNTOYCOMA RESTA SUMA UNIR WHILE YIELDinicio : \n              | sentencia inicio\n              | declaracion_funcion inicio\n              | importacion iniciosentencia : asignacion PUNTOYCOMA\n                   | expresion PUNTOYCOMA\n                   | condicional\n                   | print PUNTOYCOMA\n                   | ciclo\n                   | sentencia_yieldsentencia : error PUNTOYCOMA\n                 | error LLAVEIZQ bloque LLAVEDERdeclaracion_funcion : DECREE IDENTIFICADOR PARIZQ parametros_opcionales PARDER LLAVEIZQ bloque LLAVEDERimportacion : IMPORTAR CADENA PUNTOYCOMAparametros_opcionales : \n                             | parametros_listparametros_list : IDENTIFICADOR\n                       | IDENTIFICADOR COMA parametros_listsentencia_yield : YIELD expresion PUNTOYCOMA\n                       | YIELD PUNTOYCOMAasignacion : IDENTIFICADOR ASIGNAR expresionexpresion : expresion UNIR expresionexpresion : expresion SUMA expresion\n                 | expresion RESTA expresion\n                 | expresion MULTIPLICACION expresion\n                 | expresion DIVISION expresion\n                 | expresion MODULO expresionexpresion : expresion MAYOR expresion\n                 | expresion MENOR expresion\n                 | expresion MAYORIGUAL expresion\n                 | expresion MENORIGUAL expresion\n                 | expresion IGUAL expresion\n                 | expresion DESIGUAL expresion\n                 | expresion AND expresion\n                 | expresion OR expresion\n                 | NOT expresioncondicional : IF PARIZQ expresion PARDER LLAVEIZQ bloque LLAVEDER\n                   | IF PARIZQ expresion PARDER LLAVEIZQ bloque LLAVEDER ELSE LLAVEIZQ bloque LLAVEDERciclo : WHILE PARIZQ expresion PARDER LLAVEIZQ bloque LLAVEDER\n             | FOR PARIZQ asignacion PUNTOYCOMA expresion PUNTOYCOMA asignacion PARDER LLAVEIZQ bloque LLAVEDERbloque : \n              | sentencia bloqueexpresion : PARIZQ expresion PARDERexpresion : CADENAexpresion : NUMEROexpresion : IDENTIFICADORexpresion : MENOS expresion %prec MENOSexpresiones_list : expresion\n                        | expresion COMA expresiones_listargumentos_opcionales : \n                             | expresiones_listprint : PRINT PARIZQ expresiones_list PARDERexpresion : PARIAS PARIZQ IDENTIFICADOR PARDERexpresion : INQUIRE PARIZQ expresion PARDERexpresion : CONQUISTAR PARIZQ expresion COMA expresion COMA expresion PARDERexpresion : IDENTIFICADOR PARIZQ argumentos_opcionales PARDER'
     
-_lr_action_items = {'$end':([0,1,2,3,6,8,9,25,26,27,28,43,59,88,117,119,121,129,130,],[-1,0,-1,-1,-6,-8,-9,-2,-3,-4,-5,-7,-16,-15,-33,-35,-10,-34,-36,]),'DECREE':([0,2,3,6,8,9,27,28,43,59,88,117,119,121,129,130,],[10,10,10,-6,-8,-9,-4,-5,-7,-16,-15,-33,-35,-10,-34,-36,]),'IDENTIFICADOR':([0,2,3,6,8,9,10,12,13,16,24,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,51,52,53,54,55,56,57,59,74,88,93,96,100,101,105,106,109,110,112,114,117,119,121,125,126,129,130,],[11,11,11,-6,-8,-9,44,48,48,48,48,-4,-5,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-7,48,48,80,48,48,48,48,48,87,-16,89,-15,48,48,48,89,11,11,11,48,11,87,-33,-35,-10,11,11,-34,-36,]),'NOT':([0,2,3,6,8,9,12,13,16,24,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,52,53,54,55,56,59,88,93,96,100,105,106,109,110,112,117,119,121,125,126,129,130,],[13,13,13,-6,-8,-9,13,13,13,13,-4,-5,13,13,13,13,13,13,13,13,13,13,13,13,13,13,-7,13,13,13,13,13,13,13,-16,-15,13,13,13,13,13,13,13,13,-33,-35,-10,13,13,-34,-36,]),'PARIZQ':([0,2,3,6,8,9,11,12,13,16,17,18,19,20,21,22,23,24,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,48,52,53,54,55,56,59,88,93,96,100,105,106,109,110,112,117,119,121,125,126,129,130,],[12,12,12,-6,-8,-9,46,12,12,12,51,52,53,54,55,56,57,12,-4,-5,12,12,12,12,12,12,12,12,12,12,12,12,12,12,-7,74,12,12,46,12,12,12,12,12,-16,-15,12,12,12,12,12,12,12,12,-33,-35,-10,12,12,-34,-36,]),'CADENA':([0,2,3,6,8,9,12,13,16,24,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,52,53,54,55,56,59,88,93,96,100,105,106,109,110,112,117,119,121,125,126,129,130,],[14,14,14,-6,-8,-9,14,14,14,14,-4,-5,14,14,14,14,14,14,14,14,14,14,14,14,14,14,-7,14,14,14,14,14,14,14,-16,-15,14,14,14,14,14,14,14,14,-33,-35,-10,14,14,-34,-36,]),'NUMERO':([0,2,3,6,8,9,12,13,16,24,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,52,53,54,55,56,59,88,93,96,100,105,106,109,110,112,117,119,121,125,126,129,130,],[15,15,15,-6,-8,-9,15,15,15,15,-4,-5,15,15,15,15,15,15,15,15,15,15,15,15,15,15,-7,15,15,15,15,15,15,15,-16,-15,15,15,15,15,15,15,15,15,-33,-35,-10,15,15,-34,-36,]),'MENOS':([0,2,3,6,8,9,12,13,16,24,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,52,53,54,55,56,59,88,93,96,100,105,106,109,110,112,117,119,121,125,126,129,130,],[16,16,16,-6,-8,-9,16,16,16,16,-4,-5,16,16,16,16,16,16,16,16,16,16,16,16,16,16,-7,16,16,16,16,16,16,16,-16,-15,16,16,16,16,16,16,16,16,-33,-35,-10,16,16,-34,-36,]),'PARIAS':([0,2,3,6,8,9,12,13,16,24,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,52,53,54,55,56,59,88,93,96,100,105,106,109,110,112,117,119,121,125,126,129,130,],[17,17,17,-6,-8,-9,17,17,17,17,-4,-5,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-7,17,17,17,17,17,17,17,-16,-15,17,17,17,17,17,17,17,17,-33,-35,-10,17,17,-34,-36,]),'INQUIRE':([0,2,3,6,8,9,12,13,16,24,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,52,53,54,55,56,59,88,93,96,100,105,106,109,110,112,117,119,121,125,126,129,130,],[18,18,18,-6,-8,-9,18,18,18,18,-4,-5,18,18,18,18,18,18,18,18,18,18,18,18,18,18,-7,18,18,18,18,18,18,18,-16,-15,18,18,18,18,18,18,18,18,-33,-35,-10,18,18,-34,-36,]),'CONQUISTAR':([0,2,3,6,8,9,12,13,16,24,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,45,46,52,53,54,55,56,59,88,93,96,100,105,106,109,110,112,117,119,121,125,126,129,130,],[19,19,19,-6,-8,-9,19,19,19,19,-4,-5,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-7,19,19,19,19,19,19,19,-16,-15,19,19,19,19,19,19,19,19,-33,-35,-10,19,19,-34,-36,]),'IF':([0,2,3,6,8,9,27,28,43,59,88,105,106,109,112,117,119,121,125,126,129,130,],[20,20,20,-6,-8,-9,-4,-5,-7,-16,-15,20,20,20,20,-33,-35,-10,20,20,-34,-36,]),'PRINT':([0,2,3,6,8,9,27,28,43,59,88,105,106,109,112,117,119,121,125,126,129,130,],[21,21,21,-6,-8,-9,-4,-5,-7,-16,-15,21,21,21,21,-33,-35,-10,21,21,-34,-36,]),'WHILE':([0,2,3,6,8,9,27,28,43,59,88,105,106,109,112,117,119,121,125,126,129,130,],[22,22,22,-6,-8,-9,-4,-5,-7,-16,-15,22,22,22,22,-33,-35,-10,22,22,-34,-36,]),'FOR':([0,2,3,6,8,9,27,28,43,59,88,105,106,109,112,117,119,121,125,126,129,130,],[23,23,23,-6,-8,-9,-4,-5,-7,-16,-15,23,23,23,23,-33,-35,-10,23,23,-34,-36,]),'YIELD':([0,2,3,6,8,9,27,28,43,59,88,105,106,109,112,117,119,121,125,126,129,130,],[24,24,24,-6,-8,-9,-4,-5,-7,-16,-15,24,24,24,24,-33,-35,-10,24,24,-34,-36,]),'PUNTOYCOMA':([4,5,7,11,14,15,24,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,79,86,92,94,95,98,107,122,],[27,28,43,-42,-40,-41,59,-42,-32,-43,88,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-17,-39,100,-52,-49,-50,-48,114,-51,]),'UNIR':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[29,-42,-40,-41,29,-42,-32,-43,29,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,29,29,-39,29,29,29,29,-52,-49,-50,29,29,29,-51,]),'SUMA':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[30,-42,-40,-41,30,-42,30,-43,30,30,-19,-20,-21,-22,-23,30,30,30,30,30,30,30,30,30,30,-39,30,30,30,30,-52,-49,-50,30,30,30,-51,]),'RESTA':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[31,-42,-40,-41,31,-42,31,-43,31,31,-19,-20,-21,-22,-23,31,31,31,31,31,31,31,31,31,31,-39,31,31,31,31,-52,-49,-50,31,31,31,-51,]),'MULTIPLICACION':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[32,-42,-40,-41,32,-42,32,-43,32,32,32,32,-21,-22,-23,32,32,32,32,32,32,32,32,32,32,-39,32,32,32,32,-52,-49,-50,32,32,32,-51,]),'DIVISION':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[33,-42,-40,-41,33,-42,33,-43,33,33,33,33,-21,-22,-23,33,33,33,33,33,33,33,33,33,33,-39,33,33,33,33,-52,-49,-50,33,33,33,-51,]),'MODULO':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[34,-42,-40,-41,34,-42,34,-43,34,34,34,34,34,34,-23,34,34,34,34,34,34,34,34,34,34,-39,34,34,34,34,-52,-49,-50,34,34,34,-51,]),'MAYOR':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[35,-42,-40,-41,35,-42,-32,-43,35,35,-19,-20,-21,-22,-23,None,None,None,None,None,None,35,35,35,35,-39,35,35,35,35,-52,-49,-50,35,35,35,-51,]),'MENOR':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[36,-42,-40,-41,36,-42,-32,-43,36,36,-19,-20,-21,-22,-23,None,None,None,None,None,None,36,36,36,36,-39,36,36,36,36,-52,-49,-50,36,36,36,-51,]),'MAYORIGUAL':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[37,-42,-40,-41,37,-42,-32,-43,37,37,-19,-20,-21,-22,-23,None,None,None,None,None,None,37,37,37,37,-39,37,37,37,37,-52,-49,-50,37,37,37,-51,]),'MENORIGUAL':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[38,-42,-40,-41,38,-42,-32,-43,38,38,-19,-20,-21,-22,-23,None,None,None,None,None,None,38,38,38,38,-39,38,38,38,38,-52,-49,-50,38,38,38,-51,]),'IGUAL':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[39,-42,-40,-41,39,-42,-32,-43,39,39,-19,-20,-21,-22,-23,None,None,None,None,None,None,39,39,39,39,-39,39,39,39,39,-52,-49,-50,39,39,39,-51,]),'DESIGUAL':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[40,-42,-40,-41,40,-42,-32,-43,40,40,-19,-20,-21,-22,-23,None,None,None,None,None,None,40,40,40,40,-39,40,40,40,40,-52,-49,-50,40,40,40,-51,]),'AND':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[41,-42,-40,-41,41,-42,-32,-43,41,41,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,41,41,41,-39,41,41,41,41,-52,-49,-50,41,41,41,-51,]),'OR':([5,11,14,15,47,48,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,79,81,82,83,85,92,94,95,104,107,116,122,],[42,-42,-40,-41,42,-42,-32,-43,42,42,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,42,42,-39,42,42,42,42,-52,-49,-50,42,42,42,-51,]),'LLAVEDER':([6,8,9,27,28,43,59,88,105,106,109,111,112,113,115,117,118,119,125,126,127,128,129,130,],[-6,-8,-9,-4,-5,-7,-16,-15,-37,-37,-37,117,-37,119,121,-33,-38,-35,-37,-37,129,130,-34,-36,]),'ASIGNAR':([11,87,],[45,45,]),'PARDER':([14,15,46,47,48,49,50,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,83,84,85,89,90,91,92,94,95,103,108,116,120,122,],[-40,-41,-46,79,-42,-32,-43,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-11,-17,92,-47,-44,-39,94,95,97,98,99,-13,102,-12,-52,-49,-50,-45,-14,122,124,-51,]),'COMA':([14,15,48,49,50,60,61,62,63,64,65,66,67,68,69,70,71,72,73,78,79,82,89,92,94,95,104,122,],[-40,-41,-42,-32,-43,-18,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,93,-39,96,101,-52,-49,-50,110,-51,]),'LLAVEIZQ':([97,99,102,123,124,],[105,106,109,125,126,]),'ELSE':([117,],[123,]),}
+_lr_action_items = {'$end':([0,1,2,3,4,7,9,10,28,29,30,31,32,47,48,66,89,98,99,128,129,131,139,140,],[-1,0,-1,-1,-1,-7,-9,-10,-2,-3,-4,-5,-6,-8,-11,-20,-14,-19,-12,-37,-39,-13,-38,-40,]),'error':([0,2,3,4,7,9,10,31,32,47,48,49,66,82,89,98,99,117,118,121,128,129,131,135,136,139,140,],[11,11,11,11,-7,-9,-10,-5,-6,-8,-11,11,-20,11,-14,-19,-12,11,11,11,-37,-39,-13,11,11,-38,-40,]),'DECREE':([0,2,3,4,7,9,10,31,32,47,48,66,89,98,99,128,129,131,139,140,],[12,12,12,12,-7,-9,-10,-5,-6,-8,-11,-20,-14,-19,-12,-37,-39,-13,-38,-40,]),'IMPORTAR':([0,2,3,4,7,9,10,31,32,47,48,66,89,98,99,128,129,131,139,140,],[15,15,15,15,-7,-9,-10,-5,-6,-8,-11,-20,-14,-19,-12,-37,-39,-13,-38,-40,]),'IDENTIFICADOR':([0,2,3,4,7,9,10,12,14,17,19,27,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,58,59,60,61,62,63,64,66,82,83,89,98,99,105,108,112,113,117,118,121,122,125,128,129,131,135,136,139,140,],[13,13,13,13,-7,-9,-10,50,54,54,54,54,-5,-6,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-8,-11,13,54,54,90,54,54,54,54,54,97,-20,13,101,-14,-19,-12,54,54,54,101,13,13,13,54,97,-37,-39,-13,13,13,-38,-40,]),'NOT':([0,2,3,4,7,9,10,14,17,19,27,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,59,60,61,62,63,66,82,89,98,99,105,108,112,117,118,121,122,128,129,131,135,136,139,140,],[17,17,17,17,-7,-9,-10,17,17,17,17,-5,-6,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-8,-11,17,17,17,17,17,17,17,17,-20,17,-14,-19,-12,17,17,17,17,17,17,17,-37,-39,-13,17,17,-38,-40,]),'PARIZQ':([0,2,3,4,7,9,10,13,14,17,19,20,21,22,23,24,25,26,27,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,54,59,60,61,62,63,66,82,89,98,99,105,108,112,117,118,121,122,128,129,131,135,136,139,140,],[14,14,14,14,-7,-9,-10,52,14,14,14,58,59,60,61,62,63,64,14,-5,-6,14,14,14,14,14,14,14,14,14,14,14,14,14,14,-8,-11,14,83,14,14,52,14,14,14,14,14,-20,14,-14,-19,-12,14,14,14,14,14,14,14,-37,-39,-13,14,14,-38,-40,]),'CADENA':([0,2,3,4,7,9,10,14,15,17,19,27,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,59,60,61,62,63,66,82,89,98,99,105,108,112,117,118,121,122,128,129,131,135,136,139,140,],[16,16,16,16,-7,-9,-10,16,55,16,16,16,-5,-6,16,16,16,16,16,16,16,16,16,16,16,16,16,16,-8,-11,16,16,16,16,16,16,16,16,-20,16,-14,-19,-12,16,16,16,16,16,16,16,-37,-39,-13,16,16,-38,-40,]),'NUMERO':([0,2,3,4,7,9,10,14,17,19,27,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,59,60,61,62,63,66,82,89,98,99,105,108,112,117,118,121,122,128,129,131,135,136,139,140,],[18,18,18,18,-7,-9,-10,18,18,18,18,-5,-6,18,18,18,18,18,18,18,18,18,18,18,18,18,18,-8,-11,18,18,18,18,18,18,18,18,-20,18,-14,-19,-12,18,18,18,18,18,18,18,-37,-39,-13,18,18,-38,-40,]),'MENOS':([0,2,3,4,7,9,10,14,17,19,27,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,59,60,61,62,63,66,82,89,98,99,105,108,112,117,118,121,122,128,129,131,135,136,139,140,],[19,19,19,19,-7,-9,-10,19,19,19,19,-5,-6,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-8,-11,19,19,19,19,19,19,19,19,-20,19,-14,-19,-12,19,19,19,19,19,19,19,-37,-39,-13,19,19,-38,-40,]),'PARIAS':([0,2,3,4,7,9,10,14,17,19,27,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,59,60,61,62,63,66,82,89,98,99,105,108,112,117,118,121,122,128,129,131,135,136,139,140,],[20,20,20,20,-7,-9,-10,20,20,20,20,-5,-6,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-8,-11,20,20,20,20,20,20,20,20,-20,20,-14,-19,-12,20,20,20,20,20,20,20,-37,-39,-13,20,20,-38,-40,]),'INQUIRE':([0,2,3,4,7,9,10,14,17,19,27,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,59,60,61,62,63,66,82,89,98,99,105,108,112,117,118,121,122,128,129,131,135,136,139,140,],[21,21,21,21,-7,-9,-10,21,21,21,21,-5,-6,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-8,-11,21,21,21,21,21,21,21,21,-20,21,-14,-19,-12,21,21,21,21,21,21,21,-37,-39,-13,21,21,-38,-40,]),'CONQUISTAR':([0,2,3,4,7,9,10,14,17,19,27,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,51,52,59,60,61,62,63,66,82,89,98,99,105,108,112,117,118,121,122,128,129,131,135,136,139,140,],[22,22,22,22,-7,-9,-10,22,22,22,22,-5,-6,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-8,-11,22,22,22,22,22,22,22,22,-20,22,-14,-19,-12,22,22,22,22,22,22,22,-37,-39,-13,22,22,-38,-40,]),'IF':([0,2,3,4,7,9,10,31,32,47,48,49,66,82,89,98,99,117,118,121,128,129,131,135,136,139,140,],[23,23,23,23,-7,-9,-10,-5,-6,-8,-11,23,-20,23,-14,-19,-12,23,23,23,-37,-39,-13,23,23,-38,-40,]),'PRINT':([0,2,3,4,7,9,10,31,32,47,48,49,66,82,89,98,99,117,118,121,128,129,131,135,136,139,140,],[24,24,24,24,-7,-9,-10,-5,-6,-8,-11,24,-20,24,-14,-19,-12,24,24,24,-37,-39,-13,24,24,-38,-40,]),'WHILE':([0,2,3,4,7,9,10,31,32,47,48,49,66,82,89,98,99,117,118,121,128,129,131,135,136,139,140,],[25,25,25,25,-7,-9,-10,-5,-6,-8,-11,25,-20,25,-14,-19,-12,25,25,25,-37,-39,-13,25,25,-38,-40,]),'FOR':([0,2,3,4,7,9,10,31,32,47,48,49,66,82,89,98,99,117,118,121,128,129,131,135,136,139,140,],[26,26,26,26,-7,-9,-10,-5,-6,-8,-11,26,-20,26,-14,-19,-12,26,26,26,-37,-39,-13,26,26,-38,-40,]),'YIELD':([0,2,3,4,7,9,10,31,32,47,48,49,66,82,89,98,99,117,118,121,128,129,131,135,136,139,140,],[27,27,27,27,-7,-9,-10,-5,-6,-8,-11,27,-20,27,-14,-19,-12,27,27,27,-37,-39,-13,27,27,-38,-40,]),'PUNTOYCOMA':([5,6,8,11,13,16,18,27,54,55,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,88,96,104,106,107,110,119,132,],[31,32,47,48,-46,-44,-45,66,-46,89,-36,-47,98,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-21,-43,112,-56,-53,-54,-52,125,-55,]),'UNIR':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[33,-46,-44,-45,33,-46,-36,-47,33,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,33,33,-43,33,33,33,33,-56,-53,-54,33,33,33,-55,]),'SUMA':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[34,-46,-44,-45,34,-46,34,-47,34,34,-23,-24,-25,-26,-27,34,34,34,34,34,34,34,34,34,34,-43,34,34,34,34,-56,-53,-54,34,34,34,-55,]),'RESTA':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[35,-46,-44,-45,35,-46,35,-47,35,35,-23,-24,-25,-26,-27,35,35,35,35,35,35,35,35,35,35,-43,35,35,35,35,-56,-53,-54,35,35,35,-55,]),'MULTIPLICACION':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[36,-46,-44,-45,36,-46,36,-47,36,36,36,36,-25,-26,-27,36,36,36,36,36,36,36,36,36,36,-43,36,36,36,36,-56,-53,-54,36,36,36,-55,]),'DIVISION':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[37,-46,-44,-45,37,-46,37,-47,37,37,37,37,-25,-26,-27,37,37,37,37,37,37,37,37,37,37,-43,37,37,37,37,-56,-53,-54,37,37,37,-55,]),'MODULO':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[38,-46,-44,-45,38,-46,38,-47,38,38,38,38,38,38,-27,38,38,38,38,38,38,38,38,38,38,-43,38,38,38,38,-56,-53,-54,38,38,38,-55,]),'MAYOR':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[39,-46,-44,-45,39,-46,-36,-47,39,39,-23,-24,-25,-26,-27,None,None,None,None,None,None,39,39,39,39,-43,39,39,39,39,-56,-53,-54,39,39,39,-55,]),'MENOR':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[40,-46,-44,-45,40,-46,-36,-47,40,40,-23,-24,-25,-26,-27,None,None,None,None,None,None,40,40,40,40,-43,40,40,40,40,-56,-53,-54,40,40,40,-55,]),'MAYORIGUAL':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[41,-46,-44,-45,41,-46,-36,-47,41,41,-23,-24,-25,-26,-27,None,None,None,None,None,None,41,41,41,41,-43,41,41,41,41,-56,-53,-54,41,41,41,-55,]),'MENORIGUAL':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[42,-46,-44,-45,42,-46,-36,-47,42,42,-23,-24,-25,-26,-27,None,None,None,None,None,None,42,42,42,42,-43,42,42,42,42,-56,-53,-54,42,42,42,-55,]),'IGUAL':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[43,-46,-44,-45,43,-46,-36,-47,43,43,-23,-24,-25,-26,-27,None,None,None,None,None,None,43,43,43,43,-43,43,43,43,43,-56,-53,-54,43,43,43,-55,]),'DESIGUAL':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[44,-46,-44,-45,44,-46,-36,-47,44,44,-23,-24,-25,-26,-27,None,None,None,None,None,None,44,44,44,44,-43,44,44,44,44,-56,-53,-54,44,44,44,-55,]),'AND':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[45,-46,-44,-45,45,-46,-36,-47,45,45,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,45,45,45,-43,45,45,45,45,-56,-53,-54,45,45,45,-55,]),'OR':([6,13,16,18,53,54,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,84,87,88,91,92,93,95,104,106,107,116,119,127,132,],[46,-46,-44,-45,46,-46,-36,-47,46,46,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,46,46,-43,46,46,46,46,-56,-53,-54,46,46,46,-55,]),'LLAVEDER':([7,9,10,31,32,47,48,49,66,81,82,98,99,100,117,118,121,123,124,126,128,129,135,136,137,138,139,140,],[-7,-9,-10,-5,-6,-8,-11,-41,-20,99,-41,-19,-12,-42,-41,-41,-41,128,129,131,-37,-39,-41,-41,139,140,-38,-40,]),'LLAVEIZQ':([11,109,111,114,133,134,],[49,117,118,121,135,136,]),'ASIGNAR':([13,97,],[51,51,]),'PARDER':([16,18,52,53,54,56,57,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,85,86,87,88,90,91,93,94,95,101,102,103,104,106,107,115,120,127,130,132,],[-44,-45,-50,88,-46,-36,-47,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-15,-21,104,-51,-48,-43,106,107,109,110,111,-17,114,-16,-56,-53,-54,-49,-18,132,134,-55,]),'COMA':([16,18,54,56,57,67,68,69,70,71,72,73,74,75,76,77,78,79,80,87,88,92,101,104,106,107,116,132,],[-44,-45,-46,-36,-47,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,105,-43,108,113,-56,-53,-54,122,-55,]),'ELSE':([128,],[133,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'inicio':([0,2,3,],[1,25,26,]),'sentencia':([0,2,3,105,106,109,112,125,126,],[2,2,2,112,112,112,112,112,112,]),'declaracion_funcion':([0,2,3,],[3,3,3,]),'asignacion':([0,2,3,57,105,106,109,112,114,125,126,],[4,4,4,86,4,4,4,4,120,4,4,]),'expresion':([0,2,3,12,13,16,24,29,30,31,32,33,34,35,36,37,38,39,40,41,42,45,46,52,53,54,55,56,93,96,100,105,106,109,110,112,125,126,],[5,5,5,47,49,50,58,60,61,62,63,64,65,66,67,68,69,70,71,72,73,75,78,81,82,83,78,85,78,104,107,5,5,5,116,5,5,5,]),'condicional':([0,2,3,105,106,109,112,125,126,],[6,6,6,6,6,6,6,6,6,]),'print':([0,2,3,105,106,109,112,125,126,],[7,7,7,7,7,7,7,7,7,]),'ciclo':([0,2,3,105,106,109,112,125,126,],[8,8,8,8,8,8,8,8,8,]),'sentencia_yield':([0,2,3,105,106,109,112,125,126,],[9,9,9,9,9,9,9,9,9,]),'argumentos_opcionales':([46,],[76,]),'expresiones_list':([46,55,93,],[77,84,103,]),'parametros_opcionales':([74,],[90,]),'parametros_list':([74,101,],[91,108,]),'bloque':([105,106,109,112,125,126,],[111,113,115,118,127,128,]),}
+_lr_goto_items = {'inicio':([0,2,3,4,],[1,28,29,30,]),'sentencia':([0,2,3,4,49,82,117,118,121,135,136,],[2,2,2,2,82,82,82,82,82,82,82,]),'declaracion_funcion':([0,2,3,4,],[3,3,3,3,]),'importacion':([0,2,3,4,],[4,4,4,4,]),'asignacion':([0,2,3,4,49,64,82,117,118,121,125,135,136,],[5,5,5,5,5,96,5,5,5,5,130,5,5,]),'expresion':([0,2,3,4,14,17,19,27,33,34,35,36,37,38,39,40,41,42,43,44,45,46,49,51,52,59,60,61,62,63,82,105,108,112,117,118,121,122,135,136,],[6,6,6,6,53,56,57,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,6,84,87,91,92,93,87,95,6,87,116,119,6,6,6,127,6,6,]),'condicional':([0,2,3,4,49,82,117,118,121,135,136,],[7,7,7,7,7,7,7,7,7,7,7,]),'print':([0,2,3,4,49,82,117,118,121,135,136,],[8,8,8,8,8,8,8,8,8,8,8,]),'ciclo':([0,2,3,4,49,82,117,118,121,135,136,],[9,9,9,9,9,9,9,9,9,9,9,]),'sentencia_yield':([0,2,3,4,49,82,117,118,121,135,136,],[10,10,10,10,10,10,10,10,10,10,10,]),'bloque':([49,82,117,118,121,135,136,],[81,100,123,124,126,137,138,]),'argumentos_opcionales':([52,],[85,]),'expresiones_list':([52,62,105,],[86,94,115,]),'parametros_opcionales':([83,],[102,]),'parametros_list':([83,113,],[103,120,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,56 +27,60 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> inicio","S'",1,None,None,None),
-  ('inicio -> <empty>','inicio',0,'p_inicio','yacc.py',352),
-  ('inicio -> sentencia inicio','inicio',2,'p_inicio','yacc.py',353),
-  ('inicio -> declaracion_funcion inicio','inicio',2,'p_inicio','yacc.py',354),
-  ('sentencia -> asignacion PUNTOYCOMA','sentencia',2,'p_sentencia','yacc.py',364),
-  ('sentencia -> expresion PUNTOYCOMA','sentencia',2,'p_sentencia','yacc.py',365),
-  ('sentencia -> condicional','sentencia',1,'p_sentencia','yacc.py',366),
-  ('sentencia -> print PUNTOYCOMA','sentencia',2,'p_sentencia','yacc.py',367),
-  ('sentencia -> ciclo','sentencia',1,'p_sentencia','yacc.py',368),
-  ('sentencia -> sentencia_yield','sentencia',1,'p_sentencia','yacc.py',369),
-  ('declaracion_funcion -> DECREE IDENTIFICADOR PARIZQ parametros_opcionales PARDER LLAVEIZQ bloque LLAVEDER','declaracion_funcion',8,'p_declaracion_funcion','yacc.py',374),
-  ('parametros_opcionales -> <empty>','parametros_opcionales',0,'p_parametros_opcionales','yacc.py',379),
-  ('parametros_opcionales -> parametros_list','parametros_opcionales',1,'p_parametros_opcionales','yacc.py',380),
-  ('parametros_list -> IDENTIFICADOR','parametros_list',1,'p_parametros_list','yacc.py',387),
-  ('parametros_list -> IDENTIFICADOR COMA parametros_list','parametros_list',3,'p_parametros_list','yacc.py',388),
-  ('sentencia_yield -> YIELD expresion PUNTOYCOMA','sentencia_yield',3,'p_sentencia_yield','yacc.py',395),
-  ('sentencia_yield -> YIELD PUNTOYCOMA','sentencia_yield',2,'p_sentencia_yield','yacc.py',396),
-  ('asignacion -> IDENTIFICADOR ASIGNAR expresion','asignacion',3,'p_asignacion','yacc.py',403),
-  ('expresion -> expresion UNIR expresion','expresion',3,'p_expresion_unir','yacc.py',404),
-  ('expresion -> expresion SUMA expresion','expresion',3,'p_expresion_binaria','yacc.py',405),
-  ('expresion -> expresion RESTA expresion','expresion',3,'p_expresion_binaria','yacc.py',406),
-  ('expresion -> expresion MULTIPLICACION expresion','expresion',3,'p_expresion_binaria','yacc.py',407),
-  ('expresion -> expresion DIVISION expresion','expresion',3,'p_expresion_binaria','yacc.py',408),
-  ('expresion -> expresion MODULO expresion','expresion',3,'p_expresion_binaria','yacc.py',409),
-  ('expresion -> expresion MAYOR expresion','expresion',3,'p_expresion_logica','yacc.py',411),
-  ('expresion -> expresion MENOR expresion','expresion',3,'p_expresion_logica','yacc.py',412),
-  ('expresion -> expresion MAYORIGUAL expresion','expresion',3,'p_expresion_logica','yacc.py',413),
-  ('expresion -> expresion MENORIGUAL expresion','expresion',3,'p_expresion_logica','yacc.py',414),
-  ('expresion -> expresion IGUAL expresion','expresion',3,'p_expresion_logica','yacc.py',415),
-  ('expresion -> expresion DESIGUAL expresion','expresion',3,'p_expresion_logica','yacc.py',416),
-  ('expresion -> expresion AND expresion','expresion',3,'p_expresion_logica','yacc.py',417),
-  ('expresion -> expresion OR expresion','expresion',3,'p_expresion_logica','yacc.py',418),
-  ('expresion -> NOT expresion','expresion',2,'p_expresion_logica','yacc.py',419),
-  ('condicional -> IF PARIZQ expresion PARDER LLAVEIZQ bloque LLAVEDER','condicional',7,'p_condicional','yacc.py',425),
-  ('condicional -> IF PARIZQ expresion PARDER LLAVEIZQ bloque LLAVEDER ELSE LLAVEIZQ bloque LLAVEDER','condicional',11,'p_condicional','yacc.py',426),
-  ('ciclo -> WHILE PARIZQ expresion PARDER LLAVEIZQ bloque LLAVEDER','ciclo',7,'p_ciclo','yacc.py',432),
-  ('ciclo -> FOR PARIZQ asignacion PUNTOYCOMA expresion PUNTOYCOMA asignacion PARDER LLAVEIZQ bloque LLAVEDER','ciclo',11,'p_ciclo','yacc.py',433),
-  ('bloque -> <empty>','bloque',0,'p_bloque','yacc.py',437),
-  ('bloque -> sentencia bloque','bloque',2,'p_bloque','yacc.py',438),
-  ('expresion -> PARIZQ expresion PARDER','expresion',3,'p_expresion_parentesis','yacc.py',446),
-  ('expresion -> CADENA','expresion',1,'p_expresion_literal_cadena','yacc.py',447),
-  ('expresion -> NUMERO','expresion',1,'p_expresion_numero','yacc.py',448),
-  ('expresion -> IDENTIFICADOR','expresion',1,'p_expresion_identificador','yacc.py',449),
-  ('expresion -> MENOS expresion','expresion',2,'p_expresion_uminus','yacc.py',450),
-  ('expresiones_list -> expresion','expresiones_list',1,'p_expresiones_list','yacc.py',452),
-  ('expresiones_list -> expresion COMA expresiones_list','expresiones_list',3,'p_expresiones_list','yacc.py',453),
-  ('argumentos_opcionales -> <empty>','argumentos_opcionales',0,'p_argumentos_opcionales','yacc.py',460),
-  ('argumentos_opcionales -> expresiones_list','argumentos_opcionales',1,'p_argumentos_opcionales','yacc.py',461),
-  ('print -> PRINT PARIZQ expresiones_list PARDER','print',4,'p_print','yacc.py',469),
-  ('expresion -> PARIAS PARIZQ IDENTIFICADOR PARDER','expresion',4,'p_funcion_parias','yacc.py',472),
-  ('expresion -> INQUIRE PARIZQ expresion PARDER','expresion',4,'p_expresion_input','yacc.py',473),
-  ('expresion -> CONQUISTAR PARIZQ expresion COMA expresion COMA expresion PARDER','expresion',8,'p_funcion_conquistar','yacc.py',474),
-  ('expresion -> IDENTIFICADOR PARIZQ argumentos_opcionales PARDER','expresion',4,'p_expresion_llamada_funcion','yacc.py',480),
+  ('inicio -> <empty>','inicio',0,'p_inicio','yacc.py',434),
+  ('inicio -> sentencia inicio','inicio',2,'p_inicio','yacc.py',435),
+  ('inicio -> declaracion_funcion inicio','inicio',2,'p_inicio','yacc.py',436),
+  ('inicio -> importacion inicio','inicio',2,'p_inicio','yacc.py',437),
+  ('sentencia -> asignacion PUNTOYCOMA','sentencia',2,'p_sentencia','yacc.py',447),
+  ('sentencia -> expresion PUNTOYCOMA','sentencia',2,'p_sentencia','yacc.py',448),
+  ('sentencia -> condicional','sentencia',1,'p_sentencia','yacc.py',449),
+  ('sentencia -> print PUNTOYCOMA','sentencia',2,'p_sentencia','yacc.py',450),
+  ('sentencia -> ciclo','sentencia',1,'p_sentencia','yacc.py',451),
+  ('sentencia -> sentencia_yield','sentencia',1,'p_sentencia','yacc.py',452),
+  ('sentencia -> error PUNTOYCOMA','sentencia',2,'p_sentencia_error','yacc.py',459),
+  ('sentencia -> error LLAVEIZQ bloque LLAVEDER','sentencia',4,'p_sentencia_error','yacc.py',460),
+  ('declaracion_funcion -> DECREE IDENTIFICADOR PARIZQ parametros_opcionales PARDER LLAVEIZQ bloque LLAVEDER','declaracion_funcion',8,'p_declaracion_funcion','yacc.py',465),
+  ('importacion -> IMPORTAR CADENA PUNTOYCOMA','importacion',3,'p_importacion','yacc.py',470),
+  ('parametros_opcionales -> <empty>','parametros_opcionales',0,'p_parametros_opcionales','yacc.py',475),
+  ('parametros_opcionales -> parametros_list','parametros_opcionales',1,'p_parametros_opcionales','yacc.py',476),
+  ('parametros_list -> IDENTIFICADOR','parametros_list',1,'p_parametros_list','yacc.py',483),
+  ('parametros_list -> IDENTIFICADOR COMA parametros_list','parametros_list',3,'p_parametros_list','yacc.py',484),
+  ('sentencia_yield -> YIELD expresion PUNTOYCOMA','sentencia_yield',3,'p_sentencia_yield','yacc.py',491),
+  ('sentencia_yield -> YIELD PUNTOYCOMA','sentencia_yield',2,'p_sentencia_yield','yacc.py',492),
+  ('asignacion -> IDENTIFICADOR ASIGNAR expresion','asignacion',3,'p_asignacion','yacc.py',499),
+  ('expresion -> expresion UNIR expresion','expresion',3,'p_expresion_unir','yacc.py',500),
+  ('expresion -> expresion SUMA expresion','expresion',3,'p_expresion_binaria','yacc.py',501),
+  ('expresion -> expresion RESTA expresion','expresion',3,'p_expresion_binaria','yacc.py',502),
+  ('expresion -> expresion MULTIPLICACION expresion','expresion',3,'p_expresion_binaria','yacc.py',503),
+  ('expresion -> expresion DIVISION expresion','expresion',3,'p_expresion_binaria','yacc.py',504),
+  ('expresion -> expresion MODULO expresion','expresion',3,'p_expresion_binaria','yacc.py',505),
+  ('expresion -> expresion MAYOR expresion','expresion',3,'p_expresion_logica','yacc.py',507),
+  ('expresion -> expresion MENOR expresion','expresion',3,'p_expresion_logica','yacc.py',508),
+  ('expresion -> expresion MAYORIGUAL expresion','expresion',3,'p_expresion_logica','yacc.py',509),
+  ('expresion -> expresion MENORIGUAL expresion','expresion',3,'p_expresion_logica','yacc.py',510),
+  ('expresion -> expresion IGUAL expresion','expresion',3,'p_expresion_logica','yacc.py',511),
+  ('expresion -> expresion DESIGUAL expresion','expresion',3,'p_expresion_logica','yacc.py',512),
+  ('expresion -> expresion AND expresion','expresion',3,'p_expresion_logica','yacc.py',513),
+  ('expresion -> expresion OR expresion','expresion',3,'p_expresion_logica','yacc.py',514),
+  ('expresion -> NOT expresion','expresion',2,'p_expresion_logica','yacc.py',515),
+  ('condicional -> IF PARIZQ expresion PARDER LLAVEIZQ bloque LLAVEDER','condicional',7,'p_condicional','yacc.py',521),
+  ('condicional -> IF PARIZQ expresion PARDER LLAVEIZQ bloque LLAVEDER ELSE LLAVEIZQ bloque LLAVEDER','condicional',11,'p_condicional','yacc.py',522),
+  ('ciclo -> WHILE PARIZQ expresion PARDER LLAVEIZQ bloque LLAVEDER','ciclo',7,'p_ciclo','yacc.py',528),
+  ('ciclo -> FOR PARIZQ asignacion PUNTOYCOMA expresion PUNTOYCOMA asignacion PARDER LLAVEIZQ bloque LLAVEDER','ciclo',11,'p_ciclo','yacc.py',529),
+  ('bloque -> <empty>','bloque',0,'p_bloque','yacc.py',533),
+  ('bloque -> sentencia bloque','bloque',2,'p_bloque','yacc.py',534),
+  ('expresion -> PARIZQ expresion PARDER','expresion',3,'p_expresion_parentesis','yacc.py',542),
+  ('expresion -> CADENA','expresion',1,'p_expresion_literal_cadena','yacc.py',543),
+  ('expresion -> NUMERO','expresion',1,'p_expresion_numero','yacc.py',544),
+  ('expresion -> IDENTIFICADOR','expresion',1,'p_expresion_identificador','yacc.py',545),
+  ('expresion -> MENOS expresion','expresion',2,'p_expresion_uminus','yacc.py',546),
+  ('expresiones_list -> expresion','expresiones_list',1,'p_expresiones_list','yacc.py',548),
+  ('expresiones_list -> expresion COMA expresiones_list','expresiones_list',3,'p_expresiones_list','yacc.py',549),
+  ('argumentos_opcionales -> <empty>','argumentos_opcionales',0,'p_argumentos_opcionales','yacc.py',556),
+  ('argumentos_opcionales -> expresiones_list','argumentos_opcionales',1,'p_argumentos_opcionales','yacc.py',557),
+  ('print -> PRINT PARIZQ expresiones_list PARDER','print',4,'p_print','yacc.py',565),
+  ('expresion -> PARIAS PARIZQ IDENTIFICADOR PARDER','expresion',4,'p_funcion_parias','yacc.py',568),
+  ('expresion -> INQUIRE PARIZQ expresion PARDER','expresion',4,'p_expresion_input','yacc.py',569),
+  ('expresion -> CONQUISTAR PARIZQ expresion COMA expresion COMA expresion PARDER','expresion',8,'p_funcion_conquistar','yacc.py',570),
+  ('expresion -> IDENTIFICADOR PARIZQ argumentos_opcionales PARDER','expresion',4,'p_expresion_llamada_funcion','yacc.py',576),
 ]
@@ -0,0 +1,36 @@
+import pickle
+from yacc import FunctionDefNode
+
+# --- Snapshots del contexto global ---
+# Guarda las funciones 'decree' (con su AST ya analizado) y los valores simples del
+# contexto global en un archivo binario, para iniciar otras ejecuciones sin volver a
+# analizar ni ejecutar el preludio. Solo cargue snapshots creados por usted: el formato
+# usa pickle y un archivo modificado podría ejecutar código arbitrario.
+
+SNAPSHOT_FORMAT = "medievo-snapshot"
+SNAPSHOT_VERSION = 2  # la versión 1 guardaba cuerpos de funciones con llamadas expandidas
+
+PLAIN_TYPES = (bool, int, float, str, type(None))
+
+class SnapshotError(Exception):
+    pass
+
+def save_snapshot(path, global_context):
+    context = {name: value for name, value in global_context.items()
+               if isinstance(value, (FunctionDefNode,) + PLAIN_TYPES)}
+    data = {'format': SNAPSHOT_FORMAT, 'version': SNAPSHOT_VERSION, 'context': context}
+    with open(path, "wb") as file:
+        pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+# Devuelve un nuevo diccionario con el contexto global guardado
+def load_snapshot(path):
+    with open(path, "rb") as file:
+        try:
+            data = pickle.load(file)
+        except Exception as e:
+            raise SnapshotError(f"archivo invalido ({e})")
+    if not isinstance(data, dict) or data.get('format') != SNAPSHOT_FORMAT:
+        raise SnapshotError("el archivo no es un snapshot de Medievo")
+    if data.get('version') != SNAPSHOT_VERSION:
+        raise SnapshotError(f"version {data.get('version')} no soportada")
+    return dict(data['context'])
@@ -1,10 +1,26 @@
 import sys
+import os
+import io
+import random
+import argparse
+import contextlib
+import statistics
+import multiprocessing
+from collections import Counter
 from lexer import lexer
-from yacc import parser, format_ast_as_tree, EvaluationError, ReturnValue
+from yacc import parse_program, format_ast_as_tree, EvaluationError, ReturnValue, FunctionDefNode, set_random_generator
+from type_inference import infer_types
+from inliner import inline_calls
+from snapshot import save_snapshot, load_snapshot, SnapshotError
+from modules import resolve_imports, ModuleError
+from inputs import ValueInput, BufferedStdinInput, load_input_values, convert_input, set_input_source
+import metrics
 
 # Función principal que procesa el código fuente:
-# Realiza análisis léxico, sintáctico, genera AST y lo ejecuta
-def process_code(code, context_stack): 
+# Realiza análisis léxico, sintáctico, genera AST y lo ejecuta.
+# Devuelve True si el programa se ejecutó sin errores.
+# 'source_path' es el archivo del programa, usado para resolver las rutas de 'summon'.
+def process_code(code, context_stack, source_path=None): 
     print("\nIniciando analisis lexico...")
     lexer.input(code)
     cloned_lexer = lexer.clone()  # Clona el lexer para recorrer tokens sin perder el estado original
@@ -22,9 +38,12 @@ def process_code(code, context_stack):
     print("-> Analisis lexico completado. Revise 'lexer_output.txt' para ver los tokens")
 
     print("\nIniciando analisis sintactico...")
-    ast = parser.parse(code, lexer=lexer)  # Genera el árbol de sintaxis abstracta (AST)
-    
-    if ast:
+    ast, errors = parse_program(code, lexer)  # Genera el árbol de sintaxis abstracta (AST)
+    syntax_errors = [error for error in errors if error.kind == 'sintactico']
+
+    if syntax_errors:
+        print(f"-> Se encontraron {len(syntax_errors)} error(es) de sintaxis; el programa no se ejecutara")
+    elif ast:
         # Guarda el AST en un archivo legible
         ast_representation = format_ast_as_tree(ast)
         with open("ast_output.txt", "w", encoding="utf-8") as ast_file:
@@ -33,22 +52,50 @@ def process_code(code, context_stack):
         print("-> Analisis sintactico completado. Revise 'ast_output.txt' para ver el arbol")
         print("-> Detalles del parser guardados en 'parser.out'")
 
+        try:
+            resolve_imports(ast, source_path)  # Carga (o reutiliza) los módulos importados
+        except ModuleError as e:
+            print(e)
+            print("No se ejecuto el programa debido a errores de importacion")
+            return False
+
+        # Expande llamadas a funciones pequeñas. Con métricas activas no se expanden, para
+        # que cada llamada del programa se cuente y genere sus eventos de traza.
+        if not metrics.is_enabled():
+            inline_calls(ast, context_stack[0])
+
+        print("\nIniciando analisis de tipos...")
+        type_warnings = []
+        type_errors = infer_types(ast, context_stack[0], type_warnings)  # Anota tipos y detecta errores seguros
+        for warning in type_warnings:
+            print(f"Advertencia: {warning}")
+        if type_errors:
+            for error in type_errors:
+                print(error)
+            print("No se ejecuto el programa debido a errores de tipo")
+            return False
+        print("-> Analisis de tipos completado")
+
         print("\n--- EJECUCION DEL PROGRAMA ---")
+        completed = True
         try:
             ast.evaluate(context_stack)  # Ejecuta el árbol usando el contexto actual
         except EvaluationError as e:
             print(e)
+            completed = False
         except ReturnValue as r:
             # 'yield' fue llamado fuera de una función (advertencia)
             print(f"Advertencia: 'yield' en el contexto global con valor: {r.value}")
         
         print("--- FIN DE LA EJECUCION ---\n")
+        return completed
         
     else:
         print("No se pudo construir el AST debido a errores de sintaxis")
+    return False
 
 # Modo interactivo: permite escribir y ejecutar código desde la terminal
-def run_interactive_mode():
+def run_interactive_mode(initial_context=None):
     print("============================================================")
     print("        Terminal interactiva para su lenguaje")
     print("============================================================")
@@ -70,7 +117,7 @@ def run_interactive_mode():
 
     while True:
         try:
-            global_context = {}  # Diccionario para variables globales
+            global_context = dict(initial_context or {})  # Diccionario para variables globales
             context_stack = [global_context]  # Pila de contextos (para funciones y scopes)
             print("\n>>> Escriba su codigo aqui <<<")
             input_code = sys.stdin.read()  # Lee el código desde entrada estándar
@@ -88,25 +135,197 @@ def run_interactive_mode():
             break
 
 # Modo archivo: ejecuta el código que está guardado en un archivo de texto
-def run_file_mode(file_path):
+def run_file_mode(file_path, initial_context=None, snapshot_path=None):
     try:
         with open(file_path, "r", encoding="utf-8") as file:
             code = file.read()
         
-        global_context = {}
+        global_context = dict(initial_context or {})
         context_stack = [global_context] 
-        process_code(code, context_stack)
+        completed = process_code(code, context_stack, file_path)
+
+        # Guarda el contexto global resultante para iniciar otras ejecuciones desde él
+        if snapshot_path:
+            if completed:
+                save_snapshot(snapshot_path, global_context)
+                print(f"-> Snapshot guardado en '{snapshot_path}'")
+            else:
+                print("No se guardo el snapshot porque el programa no termino correctamente")
 
     except FileNotFoundError:
         print(f"Error: El archivo '{file_path}' no fue encontrado")
         sys.exit(1)
 
-# Punto de entrada principal: decide si se usa modo archivo o interactivo
+# Estado compartido por los trabajadores del modo barrido.
+# Se asigna antes de crear los procesos para que lo hereden (copy-on-write con fork).
+_sweep_state = {}
+
+def _init_sweep_worker():
+    # Las ejecuciones del barrido no leen de la terminal
+    sys.stdin = open(os.devnull, "r")
+
+# Ejecuta una corrida del barrido con su propio generador aleatorio determinista
+def _sweep_run(run_index):
+    set_random_generator(random.Random(f"{_sweep_state['seed']}-{run_index}"))
+    if _sweep_state['input_values'] is not None:
+        set_input_source(ValueInput(_sweep_state['input_values'], convert=False))
+    context_stack = [dict(_sweep_state['initial_context'])]
+    error = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            _sweep_state['ast'].evaluate(context_stack)
+        except EvaluationError as e:
+            error = str(e)
+        except ReturnValue:
+            pass
+    values = {name: value for name, value in context_stack[0].items() if not isinstance(value, FunctionDefNode)}
+    return values, error
+
+# Imprime las estadisticas de los valores finales de cada variable
+def print_sweep_summary(results, runs, seed):
+    print(f"\n--- RESUMEN DEL BARRIDO ({runs} ejecuciones, semilla {seed}) ---")
+    errors = Counter(error for _, error in results if error)
+    samples = {}
+    for values, _ in results:
+        for name, value in values.items():
+            samples.setdefault(name, []).append(value)
+
+    for name in sorted(samples):
+        vals = samples[name]
+        if all(isinstance(v, bool) for v in vals):
+            trues = sum(vals)
+            print(f"{name}: verdadero en {trues} de {len(vals)} ({100 * trues / len(vals):.2f}%)")
+        elif all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in vals):
+            stdev = statistics.stdev(vals) if len(vals) > 1 else 0.0
+            print(f"{name}: n={len(vals)}, media={statistics.mean(vals):.4f}, desv={stdev:.4f}, "
+                  f"min={min(vals)}, max={max(vals)}")
+        else:
+            value, count = Counter(map(str, vals)).most_common(1)[0]
+            print(f"{name}: {len(set(map(str, vals)))} valor(es) distinto(s), mas frecuente '{value}' ({count})")
+
+    if errors:
+        print(f"Ejecuciones con error: {sum(errors.values())}")
+        for error, count in errors.most_common():
+            print(f"    ({count}) {error}")
+    print("--- FIN DEL BARRIDO ---\n")
+
+# Modo barrido: analiza el programa una sola vez y lo ejecuta N veces con semillas deterministas
+def run_sweep_mode(file_path, runs, seed, jobs, initial_context=None, input_values=None):
+    try:
+        with open(file_path, "r", encoding="utf-8") as file:
+            code = file.read()
+    except FileNotFoundError:
+        print(f"Error: El archivo '{file_path}' no fue encontrado")
+        sys.exit(1)
+
+    ast, errors = parse_program(code, lexer)
+    if not ast or any(error.kind == 'sintactico' for error in errors):
+        print("No se pudo construir el AST debido a errores de sintaxis")
+        sys.exit(1)
+    try:
+        resolve_imports(ast, file_path)
+    except ModuleError as e:
+        print(e)
+        sys.exit(1)
+    initial_context = initial_context or {}
+    inline_calls(ast, initial_context)
+    type_warnings = []
+    type_errors = infer_types(ast, initial_context, type_warnings)
+    for warning in type_warnings:
+        print(f"Advertencia: {warning}")
+    if type_errors:
+        for error in type_errors:
+            print(error)
+        print("No se ejecuto el barrido debido a errores de tipo")
+        sys.exit(1)
+
+    _sweep_state['ast'] = ast
+    _sweep_state['seed'] = seed
+    _sweep_state['initial_context'] = initial_context
+    _sweep_state['input_values'] = input_values
+
+    if jobs > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        chunksize = max(1, runs // (jobs * 4))
+        with multiprocessing.get_context('fork').Pool(jobs, initializer=_init_sweep_worker) as pool:
+            results = list(pool.imap(_sweep_run, range(runs), chunksize))
+    else:
+        # Sin fork (por ejemplo en Windows) las ejecuciones se hacen en este proceso
+        original_stdin = sys.stdin
+        _init_sweep_worker()
+        try:
+            results = [_sweep_run(i) for i in range(runs)]
+        finally:
+            sys.stdin.close()
+            sys.stdin = original_stdin
+
+    print_sweep_summary(results, runs, seed)
+
+# Punto de entrada principal: decide si se usa modo archivo (uno o varios), barrido o interactivo
 def main():
-    if len(sys.argv) > 1:
-        run_file_mode(sys.argv[1])
+    arg_parser = argparse.ArgumentParser(description="Interprete del lenguaje Medievo")
+    arg_parser.add_argument("archivos", nargs="*", help="programas a ejecutar (.txt), en orden")
+    arg_parser.add_argument("--runs", type=int, help="numero de ejecuciones del modo barrido")
+    arg_parser.add_argument("--seed", type=int, help="semilla para 'parias' y 'conquistar'")
+    arg_parser.add_argument("--jobs", type=int, default=1, help="procesos del modo barrido")
+    arg_parser.add_argument("--metrics", choices=["json", "prometheus"], help="muestra metricas de la ejecucion")
+    arg_parser.add_argument("--snapshot", help="inicia desde un snapshot del contexto global")
+    arg_parser.add_argument("--save-snapshot", help="guarda el contexto global al terminar (modo archivo)")
+    arg_parser.add_argument("--input", action="append", help="valor para 'inquire' (se puede repetir)")
+    arg_parser.add_argument("--input-file", help="valores para 'inquire' desde un archivo .json, .csv o de texto")
+    args = arg_parser.parse_args()
+
+    # Valores precargados para 'inquire', convertidos una sola vez
+    input_values = None
+    if args.input_file:
+        try:
+            input_values = load_input_values(args.input_file)
+        except (OSError, ValueError) as e:
+            print(f"Error: No se pudo cargar el archivo de entradas '{args.input_file}': {e}")
+            sys.exit(1)
+    if args.input:
+        input_values = (input_values or []) + [convert_input(value) for value in args.input]
+
+    if args.save_snapshot and (len(args.archivos) != 1 or args.runs is not None):
+        arg_parser.error("--save-snapshot requiere un unico archivo en el modo archivo")
+    if args.metrics and (not args.archivos or args.runs is not None):
+        arg_parser.error("--metrics solo esta disponible en el modo archivo")
+
+    initial_context = None
+    if args.snapshot:
+        try:
+            initial_context = load_snapshot(args.snapshot)
+        except (OSError, SnapshotError) as e:
+            print(f"Error: No se pudo cargar el snapshot '{args.snapshot}': {e}")
+            sys.exit(1)
+
+    if args.runs is not None:
+        if len(args.archivos) != 1:
+            arg_parser.error("el modo barrido requiere un unico archivo")
+        if args.runs < 1 or args.jobs < 1:
+            arg_parser.error("--runs y --jobs deben ser mayores que cero")
+        run_sweep_mode(args.archivos[0], args.runs, args.seed if args.seed is not None else 0, args.jobs,
+                       initial_context, input_values)
     else:
-        run_interactive_mode()
+        if args.seed is not None:
+            set_random_generator(random.Random(args.seed))
+        if args.archivos:
+            # Varios archivos se ejecutan en el mismo proceso y comparten la caché de módulos
+            collected = metrics.enable() if args.metrics else None
+            # Sin valores precargados y con la entrada redirigida, se lee stdin con buffer
+            stdin_source = BufferedStdinInput() if input_values is None and not sys.stdin.isatty() else None
+            for file_path in args.archivos:
+                if input_values is not None:
+                    set_input_source(ValueInput(input_values, convert=False))
+                elif stdin_source:
+                    set_input_source(stdin_source)
+                run_file_mode(file_path, initial_context, args.save_snapshot)
+            if collected:
+                metrics.disable()
+                print(collected.to_json() if args.metrics == "json" else collected.to_prometheus())
+        else:
+            if input_values is not None:
+                set_input_source(ValueInput(input_values, convert=False))
+            run_interactive_mode(initial_context)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,271 @@
+import operator
+from yacc import (
+    Node, LiteralNode, IdentifierNode, BinaryOpNode, UnaryOpNode, AssignmentNode,
+    MultiPrintNode, BlockNode, IfNode, WhileNode, ForNode, PariasCallNode, InputNode,
+    ConquistarCallNode, FunctionDefNode, FunctionCallNode, ReturnNode, ImportNode,
+)
+
+# --- Inferencia estatica de tipos ---
+# Recorre el AST antes de la ejecucion y anota cada expresion con 'static_type':
+# 'int', 'float', 'str', 'bool', 'number' (int o float) o 'unknown'.
+# Los nodos cuyos tipos quedan demostrados omiten sus comprobaciones en tiempo de
+# ejecucion; los casos 'unknown' conservan las comprobaciones y mensajes de siempre.
+#
+# El analisis es insensible al flujo: el tipo de una variable global es la union de
+# todo lo que se le asigna en el nivel superior. Dentro de un 'decree' los
+# identificadores se tratan como 'unknown', porque la pila de contextos permite leer
+# variables de quien llama a la funcion.
+#
+# Solo los errores en codigo que seguro se ejecuta (sentencias del nivel superior, fuera
+# de 'judge', bucles y 'decree') impiden la ejecucion; los demas son advertencias, porque
+# ese codigo puede no ejecutarse nunca.
+
+NUMERICOS = ('bool', 'int', 'float', 'number')
+ENTEROS = ('bool', 'int')
+
+ARITMETICOS = ('inherit', 'plunder', 'forge', 'cleave', 'shatter')
+COMPARACIONES = ('>', '<', '>=', '<=')
+IGUALDADES = ('==', '!=')
+LOGICOS = ('&&', '||')
+
+# Funciones con nombre (y no lambdas) para que los nodos anotados se puedan serializar
+def _and(a, b): return a and b
+def _or(a, b): return a or b
+
+# Operaciones sin comprobaciones para los nodos con tipos demostrados.
+OPERACIONES_DIRECTAS = {
+    'inherit': operator.add,
+    'plunder': operator.sub,
+    'forge': operator.mul,
+    'cleave': operator.truediv,
+    'shatter': operator.mod,
+    'UNIR': operator.add,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '&&': _and,
+    '||': _or,
+}
+
+# Nombre mostrado en los mensajes (coincide con type(x).__name__ en tiempo de ejecucion).
+def _nombre(tipo):
+    return 'int/float' if tipo == 'number' else tipo
+
+def type_of_value(value):
+    if isinstance(value, bool): return 'bool'
+    if isinstance(value, int): return 'int'
+    if isinstance(value, float): return 'float'
+    if isinstance(value, str): return 'str'
+    return 'unknown'
+
+# Union de dos tipos. None representa "sin asignar todavia".
+def join(a, b):
+    if a is None: return b
+    if b is None or a == b: return a
+    if a in ('int', 'float', 'number') and b in ('int', 'float', 'number'): return 'number'
+    return 'unknown'
+
+def _aritmetica(op, left, right):
+    # Devuelve (tipo_resultado, es_error_seguro)
+    if left in NUMERICOS and right in NUMERICOS:
+        if op == 'cleave': return 'float', False
+        if left in ENTEROS and right in ENTEROS: return 'int', False
+        if 'float' in (left, right): return 'float', False
+        return 'number', False
+    if 'unknown' in (left, right): return 'unknown', False
+    if op == 'inherit' and left == 'str' and right == 'str': return 'str', False
+    if op == 'forge' and 'str' in (left, right) and (left in ENTEROS or right in ENTEROS):
+        return 'str', False
+    if op == 'shatter' and left == 'str': return 'unknown', False  # formato de cadenas
+    return 'unknown', True
+
+def _divisor_seguro(node):
+    # 'cleave' y 'shatter' solo omiten comprobaciones con un divisor literal distinto de cero
+    return isinstance(node, LiteralNode) and type_of_value(node.value) in NUMERICOS and node.value != 0
+
+class _Inferencia:
+    def __init__(self, global_types, function_names, errors, warnings=None):
+        self.global_types = global_types
+        self.function_names = function_names
+        self.errors = errors
+        self.warnings = warnings
+        self.certain = True  # False dentro de codigo que puede no ejecutarse
+
+    def report(self, message):
+        target = self.errors if self.certain else self.warnings
+        if target is not None and message not in target:
+            target.append(message)
+
+    def visit_uncertain(self, node, local):
+        certain, self.certain = self.certain, False
+        self.visit(node, local)
+        self.certain = certain
+
+    def visit(self, node, local):
+        # 'local' es True dentro del cuerpo de un 'decree'
+        if not isinstance(node, Node): return None
+        tipo = self.infer(node, local)
+        node.static_type = 'unknown' if tipo is None else tipo
+        return tipo
+
+    def lookup(self, name, local):
+        if local or name in self.function_names: return 'unknown'
+        return self.global_types.get(name)
+
+    def assign(self, name, tipo, local):
+        if not local:
+            self.global_types[name] = join(self.global_types.get(name), tipo)
+
+    def infer(self, node, local):
+        if isinstance(node, LiteralNode):
+            return type_of_value(node.value)
+
+        if isinstance(node, IdentifierNode):
+            return self.lookup(node.name, local)
+
+        if isinstance(node, BinaryOpNode):
+            left = self.visit(node.left, local)
+            right = self.visit(node.right, local)
+            node.fast_op = None
+            if left is None or right is None:
+                return None  # variable sin asignar: fallara en ejecucion
+            return self.binary(node, left, right)
+
+        if isinstance(node, UnaryOpNode):
+            tipo = self.visit(node.expr, local)
+            if node.op in ('NOT', '!'): return 'bool'
+            if tipo is None: return None
+            if tipo in ENTEROS: return 'int'
+            if tipo in ('float', 'number'): return tipo
+            if tipo == 'str':
+                self.report(f"Error de tipo: Operador unario '{node.op}' invalido para str.")
+            return 'unknown'
+
+        if isinstance(node, AssignmentNode):
+            self.assign(node.identifier, self.visit(node.expr, local), local)
+            return None
+
+        if isinstance(node, (MultiPrintNode, BlockNode)):
+            for child in node.get_children(): self.visit(child, local)
+            return None
+
+        if isinstance(node, IfNode):
+            self.visit(node.condition, local)
+            self.visit_uncertain(node.true_block, local)
+            if node.false_block: self.visit_uncertain(node.false_block, local)
+            return None
+
+        if isinstance(node, WhileNode):
+            self.visit(node.condition, local)
+            self.visit_uncertain(node.block, local)
+            return None
+
+        if isinstance(node, ForNode):
+            self.visit(node.init, local)
+            self.visit(node.condition, local)
+            self.visit_uncertain(node.update, local)
+            self.visit_uncertain(node.block, local)
+            return None
+
+        if isinstance(node, PariasCallNode):
+            tipo = self.lookup(node.identifier, local)
+            node.unchecked = tipo in NUMERICOS
+            if tipo == 'str':
+                self.report("Error: La variable para 'parias' debe ser numerica.")
+            self.assign(node.identifier, 'float', local)
+            return 'float'
+
+        if isinstance(node, InputNode):
+            self.visit(node.prompt_expr, local)
+            return 'unknown'
+
+        if isinstance(node, ConquistarCallNode):
+            self.visit(node.pueblo, local)
+            ejercito = self.visit(node.ejercito, local)
+            defensa = self.visit(node.defensa, local)
+            # El ejercito actualizado sigue siendo entero: no cambia el tipo de la variable
+            node.unchecked = ejercito in ENTEROS and defensa in ENTEROS
+            if ejercito in ('float', 'str'):
+                self.report("Error: El ejército debe ser un número entero.")
+            elif defensa in ('float', 'str'):
+                self.report("Error: La defensa del pueblo debe ser un número entero.")
+            return 'bool'
+
+        if isinstance(node, FunctionDefNode):
+            self.visit_uncertain(node.body, True)
+            return None
+
+        if isinstance(node, FunctionCallNode):
+            for arg in node.args: self.visit(arg, local)
+            return 'unknown'
+
+        if isinstance(node, ReturnNode):
+            if node.expr: self.visit(node.expr, local)
+            return None
+
+        return 'unknown'
+
+    def binary(self, node, left, right):
+        op = node.op
+        if op in ARITMETICOS:
+            tipo, error = _aritmetica(op, left, right)
+            if error:
+                self.report(f"Error de tipo: Operacion '{op}' invalida entre {_nombre(left)} y {_nombre(right)}.")
+            elif left in NUMERICOS and right in NUMERICOS:
+                if op not in ('cleave', 'shatter') or _divisor_seguro(node.right):
+                    node.fast_op = OPERACIONES_DIRECTAS[op]
+            elif tipo == 'str' and op == 'inherit':
+                node.fast_op = OPERACIONES_DIRECTAS[op]
+            return tipo
+
+        if op == 'UNIR':
+            if left == 'str' and right == 'str':
+                node.fast_op = OPERACIONES_DIRECTAS[op]
+            elif 'unknown' not in (left, right):
+                self.report("Error: Operacion 'UNIR' solo permitida entre cadenas.")
+            return 'str'
+
+        if op in COMPARACIONES:
+            if (left in NUMERICOS and right in NUMERICOS) or (left == 'str' and right == 'str'):
+                node.fast_op = OPERACIONES_DIRECTAS[op]
+            elif 'unknown' not in (left, right):
+                self.report(f"Error de tipo: Operacion '{op}' invalida entre {_nombre(left)} y {_nombre(right)}.")
+            return 'bool'
+
+        if op in IGUALDADES:
+            node.fast_op = OPERACIONES_DIRECTAS[op]
+            return 'bool'
+
+        if op in LOGICOS:
+            # '&&' y '||' devuelven uno de los operandos y nunca fallan por tipo
+            node.fast_op = OPERACIONES_DIRECTAS[op]
+            return join(left, right)
+
+        return 'unknown'
+
+# Punto de entrada: anota el AST y devuelve la lista de errores de tipo seguros en codigo
+# que seguro se ejecuta. 'global_context' permite considerar valores ya presentes en el
+# contexto global; si se pasa la lista 'warnings', recibe los errores del resto del codigo.
+def infer_types(ast, global_context=None, warnings=None):
+    global_types = {}
+    function_names = set()
+    for name, value in (global_context or {}).items():
+        if isinstance(value, FunctionDefNode): function_names.add(name)
+        else: global_types[name] = type_of_value(value)
+    if isinstance(ast, BlockNode):
+        for stmt in ast.statements:
+            if isinstance(stmt, FunctionDefNode): function_names.add(stmt.name)
+            elif isinstance(stmt, ImportNode) and stmt.module: function_names.update(stmt.module.functions)
+
+    # Punto fijo sobre los tipos de las variables globales
+    while True:
+        previous = dict(global_types)
+        _Inferencia(global_types, function_names, None).visit(ast, False)
+        if global_types == previous: break
+
+    errors = []
+    _Inferencia(global_types, function_names, errors, warnings).visit(ast, False)
+    return errors
@@ -1,6 +1,15 @@
 import ply.yacc as yacc
 import random
-from lexer import tokens
+from lexer import tokens, report_error, locate
+from inputs import get_input_source
+
+# Generador aleatorio usado por 'parias' y 'conquistar'.
+# Se puede reemplazar para obtener ejecuciones reproducibles (ver modo barrido).
+rng = random.Random()
+
+def set_random_generator(generator):
+    global rng
+    rng = generator
 
 # Excepción para errores semánticos (como variables no definidas, etc.)
 class EvaluationError(Exception):
@@ -24,6 +33,7 @@ def format_ast_as_tree(node, prefix=""):
 
 # Nodo base del AST (árbol de sintaxis abstracta)
 class Node:
+    static_type = 'unknown'  # Tipo anotado por la inferencia estatica (type_inference.py)
     def get_label(self): return self.__class__.__name__
     def get_children(self): return []
     def evaluate(self, context_stack): raise NotImplementedError("Evaluate no implementado")
@@ -47,6 +57,7 @@ class IdentifierNode(Node):
 
 # Nodo para operaciones binarias como suma, resta, etc.
 class BinaryOpNode(Node):
+    fast_op = None  # Operación sin comprobaciones si los tipos están demostrados
     def __init__(self, left, op, right): self.left, self.op, self.right = left, op, right
     def get_label(self): return f"BinaryOpNode: {self.op}"
     def get_children(self): return [self.left, self.right]
@@ -55,6 +66,7 @@ class BinaryOpNode(Node):
         left_val = self.left.evaluate(context_stack)
         right_val = self.right.evaluate(context_stack)
         try:
+            if self.fast_op: return self.fast_op(left_val, right_val)
             if self.op == 'inherit': return left_val + right_val
             elif self.op == 'plunder': return left_val - right_val
             elif self.op == 'forge': return left_val * right_val
@@ -102,7 +114,11 @@ class AssignmentNode(Node):
     def get_children(self): return [IdentifierNode(self.identifier), self.expr]
     def evaluate(self, context_stack):
         value = self.expr.evaluate(context_stack)
-        context_stack[-1][self.identifier] = value
+        scope = context_stack[-1]
+        # Guardar una función, o reemplazar una, cambia a qué función se refiere un nombre
+        if isinstance(value, FunctionDefNode) or isinstance(scope.get(self.identifier), FunctionDefNode):
+            invalidate_call_caches()
+        scope[self.identifier] = value
         return None
 
 # Nodo que permite imprimir múltiples valores concatenados
@@ -171,14 +187,15 @@ class ForNode(Node):
 
 # Nodo para función especial 'parias'
 class PariasCallNode(Node):
+    unchecked = False  # True si la variable es numérica de forma demostrada
     def __init__(self, identifier): self.identifier = identifier
     def get_label(self): return "PariasCallNode: parias"
     def get_children(self): return [IdentifierNode(self.identifier)]
     def evaluate(self, context_stack):
         old_value = self.get_children()[0].evaluate(context_stack)
-        if not isinstance(old_value, (int, float)):
+        if not self.unchecked and not isinstance(old_value, (int, float)):
             raise EvaluationError(f"Error: La variable para 'parias' debe ser numerica.")
-        impuesto = random.randint(1, 100)
+        impuesto = rng.randint(1, 100)
         print(f"Impuesto: '{impuesto}'%")
         sobrante = 100 - impuesto
         new_value = (old_value * sobrante) / 100
@@ -194,15 +211,14 @@ class InputNode(Node):
     def evaluate(self, context_stack):
         prompt = self.prompt_expr.evaluate(context_stack)
         try:
-            user_input = input(prompt)
-            try: return int(user_input)
-            except ValueError:
-                try: return float(user_input)
-                except ValueError: return user_input
+            # La fuente (terminal, valores precargados, stdin con buffer o cola) convierte el valor
+            return get_input_source().read(prompt)
         except Exception as e: raise EvaluationError(f"Error durante la entrada de datos: {e}")
 
 # Nodo para la función 'conquistar(pueblo, ejercito, defensa)' con lógica de batalla
 class ConquistarCallNode(Node):
+    unchecked = False  # True si ejército y defensa son enteros de forma demostrada
+
     def __init__(self, pueblo, ejercito, defensa):
         self.pueblo = pueblo
         self.ejercito = ejercito
@@ -231,12 +247,12 @@ class ConquistarCallNode(Node):
             ejercito_val = self.ejercito.evaluate(context_stack)
             ejercito_nombre = None  # No se actualiza si no es variable
 
-        if not isinstance(ejercito_val, int):
+        if not self.unchecked and not isinstance(ejercito_val, int):
             raise EvaluationError("Error: El ejército debe ser un número entero.")
 
         # Obtener defensa desde argumento
         defensa_val = self.defensa.evaluate(context_stack)
-        if not isinstance(defensa_val, int):
+        if not self.unchecked and not isinstance(defensa_val, int):
             raise EvaluationError("Error: La defensa del pueblo debe ser un número entero.")
 
         print(f"Pueblo '{pueblo_val}' tiene defensa {defensa_val}. Ejército disponible: {ejercito_val}")
@@ -247,7 +263,7 @@ class ConquistarCallNode(Node):
 
         elif ejercito_val == defensa_val:
             print(f"¡Combate igualado! El destino decidirá...")
-            if random.random() < 0.5:
+            if rng.random() < 0.5:
                 print(f"¡'{pueblo_val}' ha sido conquistado en una batalla pareja!")
                 return True
             else:
@@ -280,6 +296,15 @@ class ConquistarCallNode(Node):
 
 
 
+# Versión de las definiciones de funciones. Las cachés de cada llamada solo son válidas
+# mientras no cambie: aumenta al (re)definir una función con 'decree' o 'summon', al
+# guardar o reemplazar una función con 'devote' y al pasar una función como argumento.
+function_epoch = 0
+
+def invalidate_call_caches():
+    global function_epoch
+    function_epoch += 1
+
 # Nodo para declarar funciones con 'decree'
 class FunctionDefNode(Node):
     def __init__(self, name, params, body):
@@ -295,36 +320,54 @@ class FunctionDefNode(Node):
 
     def evaluate(self, context_stack):
         context_stack[0][self.name] = self
+        invalidate_call_caches()
         return None
 
 # Nodo para invocar funciones declaradas
 class FunctionCallNode(Node):
+    cached_def = None   # Caché en línea: función resuelta en la última llamada
+    cached_epoch = -1
+
     def __init__(self, name, args):
         self.name = name
         self.args = args 
     
     def get_label(self):
         return f"FunctionCallNode: {self.name}"
+
+    # La caché en línea no se guarda al serializar (ver snapshot.py)
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop('cached_def', None)
+        state.pop('cached_epoch', None)
+        return state
     
     def get_children(self):
         return self.args
 
-    def evaluate(self, context_stack):
-        func_def = None
+    # Busca la función en la pila de contextos. Solo se guarda en la caché de la llamada
+    # si se encontró en el contexto global.
+    def resolve(self, context_stack):
         for context in reversed(context_stack):
             if self.name in context and isinstance(context[self.name], FunctionDefNode):
-                func_def = context[self.name]
-                break
-        
-        if not func_def:
-            raise EvaluationError(f"Error: Funcion '{self.name}' no definida.")
+                if context is context_stack[0]:
+                    self.cached_def, self.cached_epoch = context[self.name], function_epoch
+                return context[self.name]
+        raise EvaluationError(f"Error: Funcion '{self.name}' no definida.")
+
+    def evaluate(self, context_stack):
+        func_def = self.cached_def
+        if self.cached_epoch != function_epoch:
+            func_def = self.resolve(context_stack)
 
-        if len(self.args) != len(func_def.params):
-            raise EvaluationError(f"Error: Funcion '{self.name}' espera {len(func_def.params)} argumentos, pero recibió {len(self.args)}.")
+        params = func_def.params
+        if len(self.args) != len(params):
+            raise EvaluationError(f"Error: Funcion '{self.name}' espera {len(params)} argumentos, pero recibió {len(self.args)}.")
 
-        new_context = {}
-        for param_name, arg_expr in zip(func_def.params, self.args):
-            new_context[param_name] = arg_expr.evaluate(context_stack) 
+        new_context = {param_name: arg_expr.evaluate(context_stack) for param_name, arg_expr in zip(params, self.args)}
+        for value in new_context.values():
+            if isinstance(value, FunctionDefNode):
+                invalidate_call_caches()  # el parámetro puede ocultar una función global
 
         context_stack.append(new_context)
 
@@ -338,6 +381,24 @@ class FunctionCallNode(Node):
 
         return return_value
 
+# Nodo para importar las funciones 'decree' de otro archivo con 'summon'.
+# El módulo se resuelve antes de ejecutar el programa (ver modules.py).
+class ImportNode(Node):
+    def __init__(self, path):
+        self.path = path
+        self.module = None
+
+    def get_label(self):
+        return f"ImportNode: summon {repr(self.path)}"
+
+    def evaluate(self, context_stack):
+        if self.module is None:
+            raise EvaluationError(f"Error: Modulo '{self.path}' no cargado.")
+        for name, func_def in self.module.functions.items():
+            context_stack[0][name] = func_def
+        invalidate_call_caches()
+        return None
+
 # Nodo para retornar un valor dentro de una función (yield)
 class ReturnNode(Node):
     def __init__(self, expr=None):
@@ -372,7 +433,8 @@ precedence = (
 def p_inicio(p):
     '''inicio : 
               | sentencia inicio
-              | declaracion_funcion inicio''' 
+              | declaracion_funcion inicio
+              | importacion inicio''' 
     if len(p) == 1:
         p[0] = BlockNode([])
     else:
@@ -390,11 +452,24 @@ def p_sentencia(p):
                    | sentencia_yield''' 
     p[0] = p[1]
 
+# Recuperación de errores: se descarta la sentencia inválida hasta ';', o hasta su bloque
+# '{ ... }' completo, y el análisis continúa para informar todos los errores en una sola
+# pasada. El bloque se analiza como tal, así que su '}' no cierra el bloque exterior.
+def p_sentencia_error(p):
+    '''sentencia : error PUNTOYCOMA
+                 | error LLAVEIZQ bloque LLAVEDER'''
+    p[0] = None
+
 # Declaración de funciones con 'decree'
 def p_declaracion_funcion(p):
     '''declaracion_funcion : DECREE IDENTIFICADOR PARIZQ parametros_opcionales PARDER LLAVEIZQ bloque LLAVEDER'''
     p[0] = FunctionDefNode(p[2], p[4], p[7])
 
+# Importación de módulos con 'summon'
+def p_importacion(p):
+    '''importacion : IMPORTAR CADENA PUNTOYCOMA'''
+    p[0] = ImportNode(p[2])
+
 # Declaración de funciones con 'decree'
 def p_parametros_opcionales(p):
     '''parametros_opcionales : 
@@ -502,12 +577,29 @@ def p_expresion_llamada_funcion(p):
     p[0] = FunctionCallNode(p[1], p[3])
 
 
+# Lexer de la entrada actual (para ubicar un error al final del archivo)
+_active_lexer = None
+
 def p_error(p):
     if p:
-        try:
-            lines = p.lexer.lexdata.splitlines(); error_line = lines[p.lineno - 1]
-            print(f"Error de sintaxis en la linea {p.lineno}, token '{p.value}': -> {error_line.strip()}")
-        except (IndexError, AttributeError): print(f"Error de sintaxis cerca del token '{p.value}'")
+        lineno, _, error_line = locate(p.lexer, p.lexpos)
+        report_error(p.lexer, 'sintactico', p.lexpos, f"Error de sintaxis en la linea {lineno}, token '{p.value}': -> {error_line.strip()}")
+    elif _active_lexer is not None:
+        # Se ubica en el último carácter visible, para no apuntar a una línea inexistente
+        end = max(len(_active_lexer.lexdata.rstrip()) - 1, 0)
+        report_error(_active_lexer, 'sintactico', end, "Error de sintaxis al final del archivo.")
     else: print("Error de sintaxis al final del archivo.")
 
-parser = yacc.yacc(debug=True)
\ No newline at end of file
+# Analiza el código completo y devuelve (ast, errores) con todos los errores léxicos y sintácticos.
+def parse_program(code, lexer):
+    global _active_lexer
+    lexer.errors = []
+    lexer.lineno = 1
+    _active_lexer = lexer
+    try:
+        ast = parser.parse(code, lexer=lexer)
+    finally:
+        _active_lexer = None
+    return ast, lexer.errors
+
+parser = yacc.yacc(debug=True)